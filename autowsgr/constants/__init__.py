@@ -9,6 +9,7 @@ from .shipnames import (
     normalize_ship_name,
     set_ship_name_aliases,
     ship_name_identity,
+    ship_names_generation,
     update_shipnames,
 )
 
@@ -24,5 +25,6 @@ __all__ = [
     'normalize_ship_name',
     'set_ship_name_aliases',
     'ship_name_identity',
+    'ship_names_generation',
     'update_shipnames',
 ]
@@ -50,6 +50,7 @@ _SHIPNAME_TO_GROUP: dict[str, str] = {
     name: group_id for group_id, names in SHIPNAME_GROUPS.items() for name in names
 }
 SHIPNAMES: list[str] = process_dict(SHIPNAME_GROUPS)
+_generation: int = 0
 
 # 决战中出现的非舰船名卡片（副官技能等）
 DECISIVE_SKILL_NAMES: list[str] = ['长跑训练', '肌肉记忆', '黑科技']
@@ -119,12 +120,11 @@ def ship_name_identity(value: object) -> str | None:
 
 def expand_ship_name_candidates(candidates: list[str]) -> list[str]:
     """将候选舰名扩展为每个候选所在舰船组的全部名称。"""
-    expanded: list[str] = []
-    for candidate in candidates:
-        for name in get_ship_name_variants(candidate):
-            if name not in expanded:
-                expanded.append(name)
-    return expanded
+    return list(
+        dict.fromkeys(
+            name for candidate in candidates for name in get_ship_name_variants(candidate)
+        )
+    )
 
 
 def set_ship_name_aliases(aliases: Mapping[str, str]) -> None:
@@ -142,8 +142,19 @@ def set_ship_name_aliases(aliases: Mapping[str, str]) -> None:
     _rebuild_shipnames()
 
 
+def ship_names_generation() -> int:
+    """舰名分组数据的版本号。
+
+    每次舰名分组或扁平舰名列表变更后递增，依赖舰名数据的缓存可将其
+    纳入缓存键以自动失效。
+    """
+    return _generation
+
+
 def _rebuild_shipnames() -> None:
     """原地刷新扁平舰名列表和舰名到分组的索引。"""
+    global _generation  # noqa: PLW0603
+    _generation += 1
     _SHIPNAME_TO_GROUP.clear()
     _SHIPNAME_TO_GROUP.update(
         {name: group_id for group_id, names in SHIPNAME_GROUPS.items() for name in names},
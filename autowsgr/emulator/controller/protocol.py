@@ -73,6 +73,10 @@ class AndroidController(ABC):
     def screenshot(self) -> np.ndarray:
         """截取当前屏幕，返回 RGB uint8 数组 ``(H, W, 3)``。
 
+        返回的数组为 C 连续、只读 (``flags.writeable == False``)，
+        且可能与其他调用方共享同一帧；视觉层直接使用，不做形状/类型校验，
+        需要修改时请先 ``copy()``。
+
         Raises
         ------
         EmulatorConnectionError
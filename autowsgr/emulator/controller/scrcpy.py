@@ -74,6 +74,9 @@ _POINTER_ID_FINGER = -2
 # 同一手势内相邻控制消息（如 DOWN→UP、按键 DOWN→UP）之间的最小间隔。
 _MIN_GESTURE_INTERVAL = 0.01  # 10ms
 
+# screenshot() 等待首帧时单次阻塞上限，超时后复查视频流是否存活
+_FRAME_WAIT_SLICE = 0.05
+
 
 class ScrcpyController(AndroidController):
     """基于 scrcpy 协议的 Android 设备控制器。
@@ -351,6 +354,9 @@ class ScrcpyController(AndroidController):
                 for packet in codec.parse(raw):
                     for frame in codec.decode(packet):
                         rgb = frame.to_ndarray(format='rgb24')
+                        # 同一帧会被多次 screenshot() 返回给不同调用方，
+                        # 在源头冻结为只读 C 连续 uint8，下游检测无需再校验或拷贝
+                        rgb.flags.writeable = False
                         h, w = rgb.shape[:2]
 
                         with self._frame_lock:
@@ -569,6 +575,12 @@ class ScrcpyController(AndroidController):
     # ── 截图 ──
 
     def screenshot(self) -> np.ndarray:
+        """返回解码线程最新一帧的引用 (零拷贝)。
+
+        轮询期间不会为每次调用分配新数组：同一帧在新帧解码前被重复返回，
+        新帧由解码线程整体替换引用而非原地覆写，因此调用方持有的旧帧不会
+        被改写。帧在解码时已冻结为只读。
+        """
         self._ensure_stream_alive()
 
         start = time.monotonic()
@@ -592,11 +604,13 @@ class ScrcpyController(AndroidController):
                 start = time.monotonic()
                 continue
 
-            if time.monotonic() - start > self._screenshot_timeout:
+            remaining = self._screenshot_timeout - (time.monotonic() - start)
+            if remaining <= 0:
                 raise EmulatorConnectionError(
                     f'截图超时 ({self._screenshot_timeout}s)，scrcpy 视频流无数据'
                 )
-            time.sleep(0.01)
+            # 阻塞等待解码线程的首帧信号，帧到达即唤醒；分片等待以便及时发现断流
+            self._frame_ready.wait(timeout=min(remaining, _FRAME_WAIT_SLICE))
 
     # ── 触控 ──
     # 引入一个开关，当参数为：click(x, y, delay=False) 时关闭延迟，该方法默认打开全局延迟，全局延迟可以在 config.py 内设置
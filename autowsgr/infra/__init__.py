@@ -33,7 +33,7 @@ from .exceptions import (
     VisionError,
 )
 from .file_utils import load_yaml, merge_dicts, resolve_plan_path, save_yaml
-from .logger import caller_info, get_logger, save_image, setup_logger
+from .logger import caller_info, get_logger, level_enabled, save_image, setup_logger
 
 
 __all__ = [
@@ -67,6 +67,7 @@ __all__ = [
     'VisionError',
     'caller_info',
     'get_logger',
+    'level_enabled',
     'load_yaml',
     'merge_dicts',
     'resolve_plan_path',
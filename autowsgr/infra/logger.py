@@ -97,6 +97,9 @@ _DEFAULT_CHANNEL_LEVEL: int | None = None
 # 当前通道过滤配置 (由 setup_logger 设置)
 _channel_levels: dict[str, int] = {}
 
+# 所有 sink 中最低的级别数值 (由 setup_logger 设置)；未配置时为 loguru 默认 sink 的 DEBUG
+_min_level_no: int = _LEVEL_MAP['DEBUG']
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Patcher
@@ -242,6 +245,23 @@ def get_logger(channel: str) -> Logger:
     return logger.bind(ch=channel)
 
 
+def level_enabled(level: str) -> bool:
+    """判断 *level* 级别的日志是否可能被任一 sink 接收。
+
+    仅检查 :func:`setup_logger` 注册的 sink 中的最低级别 (通道过滤在各
+    sink 的 filter 中执行)，用于在热路径中跳过只为日志服务的昂贵计算。
+    未知级别名返回 False。
+
+    Examples
+    --------
+    ::
+
+        if level_enabled("DEBUG"):
+            _log.debug("当前页面: {}", get_current_page(screen))
+    """
+    return _LEVEL_MAP.get(level.upper(), 0) >= _min_level_no
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # setup_logger
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -287,7 +307,7 @@ def setup_logger(
 
         未列出的通道跟随 sink 自身的 *level* 设置。
     """
-    global _image_dir, _channel_levels  # noqa: PLW0603
+    global _image_dir, _channel_levels, _min_level_no  # noqa: PLW0603
 
     # 解析通道级别配置
     _channel_levels = {}
@@ -312,10 +332,13 @@ def setup_logger(
     )
 
     # 控制台 sink — 级别过滤 + 通道过滤
+    # sink 级别与 filter 的基础级别一致 (通道只能在其之上收紧)，使 loguru 的全局
+    # 最低级别反映真实阈值，lazy 参数才能跳过被过滤的日志
     console_level_no = _LEVEL_MAP.get(level.upper(), 20)
+    _min_level_no = console_level_no
     logger.add(
         sys.stderr,
-        level=0,  # 由 filter 全权控制
+        level=console_level_no,
         filter=_make_channel_filter(console_level_no),
         format=_fmt,
     )
@@ -325,6 +348,7 @@ def setup_logger(
         log_dir.mkdir(parents=True, exist_ok=True)
 
         # 全量文件：固定 DEBUG，**不做**通道过滤（记录一切）
+        _min_level_no = min(_min_level_no, _LEVEL_MAP['DEBUG'])
         logger.add(
             log_dir / 'autowsgr_{time:YYYY-MM-DD}.debug.log',
             level='DEBUG',
@@ -338,7 +362,7 @@ def setup_logger(
         if level.upper() != 'DEBUG':
             logger.add(
                 log_dir / 'autowsgr_{time:YYYY-MM-DD}.log',
-                level=0,
+                level=console_level_no,
                 filter=_make_channel_filter(console_level_no),
                 rotation=rotation,
                 retention=retention,
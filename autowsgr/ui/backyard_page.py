@@ -64,6 +64,9 @@ PAGE_SIGNATURE = PixelSignature(
 )
 """后院页面像素签名 — 检测后院背景及装饰特征。"""
 
+_PAGE_CHECKER = PixelChecker.compile_signature(PAGE_SIGNATURE)
+""":data:`PAGE_SIGNATURE` 的编译检测函数 (页面注册表高频轮询使用)。"""
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 点击坐标
@@ -113,8 +116,7 @@ class BackyardPage:
         screen:
             截图 (HxWx3, RGB)。
         """
-        result = PixelChecker.check_signature(screen, PAGE_SIGNATURE)
-        return result.matched
+        return _PAGE_CHECKER(screen)
 
     # ── 导航 ──────────────────────────────────────────────────────────────
 
@@ -100,6 +100,9 @@ PAGE_SIGNATURE = PixelSignature(
 )
 """出征准备页面像素签名。"""
 
+_PAGE_CHECKER = PixelChecker.compile_signature(PAGE_SIGNATURE)
+""":data:`PAGE_SIGNATURE` 的编译检测函数 (页面注册表高频轮询使用)。"""
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 基类
@@ -139,8 +142,7 @@ class BaseBattlePreparation:
     @staticmethod
     def is_current_page(screen: np.ndarray) -> bool:
         """判断截图是否为出征准备页面。"""
-        result = PixelChecker.check_signature(screen, PAGE_SIGNATURE)
-        return result.matched
+        return _PAGE_CHECKER(screen)
 
     # ── 状态查询 — 舰队 / 面板 ────────────────────────────────────────────
 
@@ -54,6 +54,9 @@ PAGE_SIGNATURE = PixelSignature(
 )
 """食堂页面像素签名 (来自 sig.py 重新采集)。"""
 
+_PAGE_CHECKER = PixelChecker.compile_signature(PAGE_SIGNATURE)
+""":data:`PAGE_SIGNATURE` 的编译检测函数 (页面注册表高频轮询使用)。"""
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 点击坐标
@@ -129,8 +132,7 @@ class CanteenPage:
         screen:
             截图 (HxWx3, RGB)。
         """
-        result = PixelChecker.check_signature(screen, PAGE_SIGNATURE)
-        return result.matched
+        return _PAGE_CHECKER(screen)
 
     # ── 回退 ──────────────────────────────────────────────────────────────
 
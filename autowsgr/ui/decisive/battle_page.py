@@ -57,6 +57,9 @@ PAGE_SIGNATURE = PixelSignature(
 )
 """决战页面像素签名。"""
 
+_PAGE_CHECKER = PixelChecker.compile_signature(PAGE_SIGNATURE)
+""":data:`PAGE_SIGNATURE` 的编译检测函数 (页面注册表高频轮询使用)。"""
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 坐标常量 (相对坐标 0.0-1.0, 参考分辨率 960x540)
@@ -165,7 +168,7 @@ class DecisiveBattlePage:
     @staticmethod
     def is_current_page(screen: np.ndarray) -> bool:
         """判断截图是否为决战总览页。"""
-        return PixelChecker.check_signature(screen, PAGE_SIGNATURE).matched
+        return _PAGE_CHECKER(screen)
 
     # ── 小关进度识别 ──────────────────────────────────────────────────────
 
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 
 from autowsgr.infra.logger import get_logger
 from autowsgr.types import PageName
-from autowsgr.vision import PixelChecker
+from autowsgr.vision import CompositePixelSignature, PixelChecker
 
 from .constants import (
     NavCoord,
@@ -31,6 +31,17 @@ if TYPE_CHECKING:
 
 _log = get_logger('ui')
 
+_PAGE_OR_OVERLAY = PixelChecker.compile_signature(
+    CompositePixelSignature.any_of(
+        'main_page_or_overlay',
+        Sig.PAGE.ps,
+        Sig.NEWS.ps,
+        Sig.SIGN.ps,
+        Sig.BOOKING.ps,
+    )
+)
+"""主页面基础态 + 三种浮层的编译检测函数，各签名共享一次像素采样。"""
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 目标页面检测器 (延迟导入)
@@ -98,13 +109,7 @@ class MainPage:
         参考 :class:`~autowsgr.ui.event.event_page.BaseEventPage` 模式，
         将浮层 (新闻公告 / 每日签到 / 活动预约) 也识别为主页面。
         """
-        if PixelChecker.check_signature(screen, Sig.PAGE.ps).matched:
-            return True
-        if PixelChecker.check_signature(screen, Sig.NEWS.ps).matched:
-            return True
-        if PixelChecker.check_signature(screen, Sig.SIGN.ps).matched:
-            return True
-        return PixelChecker.check_signature(screen, Sig.BOOKING.ps).matched
+        return _PAGE_OR_OVERLAY(screen)
 
     @staticmethod
     def is_base_page(screen: np.ndarray) -> bool:
@@ -42,36 +42,69 @@ _log = get_logger('ui')
 _PAGE_REGISTRY: dict[str, Callable[[np.ndarray], bool]] = {}
 
 
+def _safe_checker(
+    name: str,
+    checker: Callable[[np.ndarray], bool],
+) -> Callable[[np.ndarray], bool]:
+    """包装识别函数: 异常视为不匹配，仅首次异常输出堆栈。
+
+    原函数保存在 ``__wrapped__`` 上，供 :func:`get_current_page` 的 ``skip`` 比较。
+    """
+    failed = False
+
+    def _safe(screen: np.ndarray) -> bool:
+        nonlocal failed
+        try:
+            return checker(screen)
+        except Exception:
+            if not failed:
+                failed = True
+                _log.opt(exception=True).warning("[UI] 页面 '{}' 识别器异常", name)
+            else:
+                _log.debug("[UI] 页面 '{}' 识别器再次异常，视为不匹配", name)
+            return False
+
+    _safe.__wrapped__ = checker  # type: ignore[attr-defined]
+    return _safe
+
+
 def register_page(name: str, checker: Callable[[np.ndarray], bool]) -> None:
-    """注册页面识别函数。"""
+    """注册页面识别函数。
+
+    识别函数在注册时包装一次 (见 :func:`_safe_checker`)，
+    :func:`get_current_page` 遍历时无需逐个 try/except。
+    """
     # Python 3.13+ 中 StrEnum 的 str()/format() 返回 'ClassName.MEMBER' 而非值，
     # 显式提取 .value 确保 key 始终为纯 str，避免日志和比较中出现意外格式。
     key: str = name.value if hasattr(name, 'value') else name
     if key in _PAGE_REGISTRY:
         _log.warning("[UI] 页面 '{}' 已注册，将覆盖", key)
-    _PAGE_REGISTRY[key] = checker
+    _PAGE_REGISTRY[key] = _safe_checker(key, checker)
     # _log.debug("[UI] 注册页面: {}", key)
 
 
-def get_current_page(screen: np.ndarray) -> str | None:
-    """识别截图对应的页面名称，无匹配返回 ``None``。"""
-    failed_checkers: list[str] = []
+def get_current_page(
+    screen: np.ndarray,
+    *,
+    skip: Callable[[np.ndarray], bool] | None = None,
+) -> str | None:
+    """识别截图对应的页面名称，无匹配返回 ``None``。
+
+    Parameters
+    ----------
+    screen:
+        截图 (HxWx3, RGB)。
+    skip:
+        已知在此截图上返回 ``False`` 的识别器 (如轮询中刚失败的目标 checker)，
+        注册表中与之为同一对象的项不再重复执行。
+    """
     for name, checker in _PAGE_REGISTRY.items():
-        try:
-            if checker(screen):
-                _log.debug('[UI] 当前页面: {}', name)
-                return name
-        except Exception:
-            _log.opt(exception=True).warning("[UI] 页面 '{}' 识别器异常", name)
-            failed_checkers.append(name)
-    if failed_checkers:
-        _log.warning(
-            '[UI] 无匹配页面，且以下识别器抛异常: {} (共 {} 个注册页面)',
-            failed_checkers,
-            len(_PAGE_REGISTRY),
-        )
-    else:
-        _log.debug('[UI] 当前页面: 无匹配 (共 {} 个注册页面)', len(_PAGE_REGISTRY))
+        if skip is not None and checker.__wrapped__ is skip:
+            continue
+        if checker(screen):
+            _log.debug('[UI] 当前页面: {}', name)
+            return name
+    _log.debug('[UI] 当前页面: 无匹配 (共 {} 个注册页面)', len(_PAGE_REGISTRY))
     return None
 
 
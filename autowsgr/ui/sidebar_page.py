@@ -23,22 +23,20 @@ from __future__ import annotations
 
 import enum
 import time
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from autowsgr.infra.logger import get_logger
 from autowsgr.types import PageName
 from autowsgr.ui.utils import click_and_wait_for_page, wait_for_page
-from autowsgr.vision import (
-    Color,
-    PixelChecker,
-)
+from autowsgr.vision import Color
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    import numpy as np
-
     from autowsgr.context import GameContext
 
 
@@ -81,6 +79,28 @@ _MENU_SELECTED = Color.of(0, 160, 232)
 _MENU_TOLERANCE = 30.0
 """菜单项颜色匹配容差。"""
 
+_MENU_PROBE_XY = np.array(MENU_PROBES, dtype=np.float64)
+""":data:`MENU_PROBES` 的 (N, 2) 数组形式，供向量化取样。"""
+
+_MENU_COLORS = np.array(
+    [_MENU_SELECTED.as_rgb_tuple(), _MENU_GRAY.as_rgb_tuple()],
+    dtype=np.int32,
+)
+"""参考颜色 (2, 3): 第 0 行蓝色高亮，第 1 行灰色。"""
+
+_MENU_TOL_SQ = _MENU_TOLERANCE * _MENU_TOLERANCE
+"""容差平方 — 与距离平方比较，省去开方。"""
+
+
+@lru_cache(maxsize=4)
+def _menu_probe_index(h: int, w: int) -> tuple[np.ndarray, np.ndarray]:
+    """菜单探测点在 ``h x w`` 截图上的绝对 (行, 列) 索引 (按分辨率缓存)。"""
+    rows = (_MENU_PROBE_XY[:, 1] * h).astype(np.intp)
+    cols = (_MENU_PROBE_XY[:, 0] * w).astype(np.intp)
+    rows.flags.writeable = False
+    cols.flags.writeable = False
+    return rows, cols
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 导航按钮点击坐标
@@ -121,6 +141,23 @@ SUBMENU_DELAY: float = 1.25
 """点击菜单项后等待二级菜单弹出的延迟 (秒)。"""
 
 
+@lru_cache(maxsize=1)
+def _target_checkers() -> dict[SidebarTarget, Callable[[np.ndarray], bool]]:
+    """各导航目标页面的识别函数 (首次调用时导入并缓存)。
+
+    目标页面模块在函数内导入，避免与侧边栏模块循环导入。
+    """
+    from autowsgr.ui.build_page import BuildPage
+    from autowsgr.ui.friend_page import FriendPage
+    from autowsgr.ui.intensify_page import IntensifyPage
+
+    return {
+        SidebarTarget.BUILD: BuildPage.is_current_page,
+        SidebarTarget.INTENSIFY: IntensifyPage.is_current_page,
+        SidebarTarget.FRIEND: FriendPage.is_current_page,
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 页面控制器
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -157,16 +194,12 @@ class SidebarPage:
         screen:
             截图 (HxWx3, RGB)。
         """
-        blue_count = 0
-        for x, y in MENU_PROBES:
-            pixel = PixelChecker.get_pixel(screen, x, y)
-            if pixel.near(_MENU_SELECTED, _MENU_TOLERANCE):
-                blue_count += 1
-            elif pixel.near(_MENU_GRAY, _MENU_TOLERANCE):
-                pass  # 灰色 — 正常
-            else:
-                return False  # 既不灰也不蓝 → 不是侧边栏
-        return blue_count <= 1
+        # 一次取出全部探测点，与两种参考色同时比较 → near 形状 (6, 2)
+        index = _menu_probe_index(*screen.shape[:2])
+        diff = screen[index].astype(np.int32)[:, None, :] - _MENU_COLORS
+        near = (diff * diff).sum(axis=2) <= _MENU_TOL_SQ
+        # 每个点既不灰也不蓝 → 不是侧边栏; 蓝色至多 1 个
+        return bool(near.any(axis=1).all() and near[:, 0].sum() <= 1)
 
     # ── 导航 ──────────────────────────────────────────────────────────────
 
@@ -186,29 +219,18 @@ class SidebarPage:
         NavigationError
             超时未到达目标页面。
         """
-        from autowsgr.ui.build_page import BuildPage
-        from autowsgr.ui.friend_page import FriendPage
-        from autowsgr.ui.intensify_page import IntensifyPage
-
-        target_checker = {
-            SidebarTarget.BUILD: BuildPage.is_current_page,
-            SidebarTarget.INTENSIFY: IntensifyPage.is_current_page,
-            SidebarTarget.FRIEND: FriendPage.is_current_page,
-        }
+        checker = _target_checkers()[target]
         _log.info('[UI] 侧边栏 → {}', target.value)
 
         if target in _SUBMENU_TARGETS:
             # 二级菜单: 点击侧边栏项 → 等弹出 → 点击子选项 → 验证
-            self._navigate_with_submenu(
-                target,
-                target_checker[target],
-            )
+            self._navigate_with_submenu(target, checker)
         else:
             # 单次点击 (好友)
             click_and_wait_for_page(
                 self._ctrl,
                 click_coord=CLICK_NAV[target],
-                checker=target_checker[target],
+                checker=checker,
                 source=PageName.SIDEBAR,
                 target=target.value,
             )
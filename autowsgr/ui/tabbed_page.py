@@ -14,8 +14,8 @@
 1. **标签栏探测** — 5 个固定位置，恰好 1 个蓝色 + 其余暗色
    → 确认为标签页，蓝色索引 = 激活标签 (0-4)
 
-2. **模板匹配** — 对标签栏区域 (顶部 7.5%、左侧 63%) 进行自适应
-   二值化，缩放到标准尺寸 (600x40) 后与 5 个参考模板逐一比较，
+2. **模板匹配** — 将标签栏区域 (顶部 7.5%、左侧 63%) 缩放到标准尺寸
+   (600x40) 后进行自适应二值化，与 5 个参考模板逐一比较，
    取覆盖度 (coverage) 最高者为页面类型。
 
 模板匹配原理
@@ -45,6 +45,7 @@
 
     from autowsgr.ui.tabbed_page import (
         TabbedPageType,
+        classify,
         is_tabbed_page,
         get_active_tab_index,
         identify_page_type,
@@ -57,6 +58,8 @@
         idx = get_active_tab_index(screen)        # 0-4
         page = identify_page_type(screen)          # MAP / BUILD / FRIEND / ...
 
+    state = classify(screen)                       # 一次得到 is_tabbed / page_type / active_tab
+
     # 用于 click_and_wait_for_page 的 checker
     checker = make_tab_checker(TabbedPageType.MAP, tab_index=2)
 """
@@ -64,6 +67,9 @@
 from __future__ import annotations
 
 import enum
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -72,7 +78,7 @@ import cv2
 import numpy as np
 
 from autowsgr.types import PageName
-from autowsgr.vision import Color, PixelChecker
+from autowsgr.vision import Color
 
 
 # from autowsgr.infra.logger import get_logger
@@ -82,6 +88,7 @@ from autowsgr.vision import Color, PixelChecker
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from concurrent.futures import Future
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -124,6 +131,16 @@ TAB_BLUE_TOLERANCE: float = 35.0
 TAB_DARK_MAX: int = 80
 """非激活探测点最大通道阈值 — 超过此值不算 "暗色"。"""
 
+_TAB_PROBE_XY = np.array(TAB_PROBES, dtype=np.float64)
+""":data:`TAB_PROBES` 的 (N, 2) 数组形式，供向量化取样。"""
+
+_TAB_BLUE_RGB = np.array(TAB_BLUE.as_rgb_tuple(), dtype=np.int32)
+_TAB_BLUE_TOL_SQ = TAB_BLUE_TOLERANCE * TAB_BLUE_TOLERANCE
+
+_TAB_DARK_LO = np.zeros(3, dtype=np.uint8)
+_TAB_DARK_HI = np.full(3, TAB_DARK_MAX - 1, dtype=np.uint8)
+"""暗色判定的 ``cv2.inRange`` 闭区间: 各通道 < :data:`TAB_DARK_MAX`。"""
+
 
 # ── 非激活标签参考暗色 ──
 
@@ -156,16 +173,42 @@ _ADAPTIVE_BLOCK: int = 21
 _ADAPTIVE_C: int = -5
 """自适应二值化常数 C (负值使更多像素变白)。"""
 
+_MIN_COVERAGE: float = 0.6
+"""判定为某页面类型所需的最低覆盖度 (严格大于)。"""
+
+
+_HAS_BITWISE_COUNT: bool = hasattr(np, 'bitwise_count')
+"""当前 NumPy 是否提供 ``np.bitwise_count`` (2.0+)。"""
+
+
+def _pack(mask: np.ndarray) -> np.ndarray:
+    """将布尔掩码按位打包为 uint64 数组 (600x40 → 375 个字)。
+
+    打包后交集为逐字 ``&``，计数为 :func:`_popcount`，
+    数据量仅为布尔数组的 1/8。
+    """
+    return np.packbits(mask).view(np.uint64)
+
+
+def _popcount(packed: np.ndarray) -> int:
+    """打包数组中置位的总数 (白色像素数)。
+
+    ``np.bitwise_count`` 需要 NumPy 2.0+，旧版本回退为 ``np.unpackbits`` 逐位求和。
+    """
+    if _HAS_BITWISE_COUNT:
+        return int(np.bitwise_count(packed).sum())
+    return int(np.unpackbits(packed.view(np.uint8)).sum())
+
 
 def _load_templates() -> dict[TabbedPageType, np.ndarray]:
     """从 ``autowsgr/ui/templates/`` 加载 5 个参考模板。
 
-    模板为二值 PNG (0/255)，尺寸 600x40。
+    模板为二值 PNG (0/255)，尺寸 600x40，按单通道灰度解码。
 
     Returns
     -------
     dict[TabbedPageType, np.ndarray]
-        布尔数组 (True = 白色像素)。
+        按位打包的模板 (见 :func:`_pack`)，置位 = 白色像素。
     """
     mapping = {
         TabbedPageType.MAP: 'map.png',
@@ -177,28 +220,66 @@ def _load_templates() -> dict[TabbedPageType, np.ndarray]:
     result: dict[TabbedPageType, np.ndarray] = {}
     for page_type, filename in mapping.items():
         path = _TEMPLATE_DIR / filename
+        # 经 imdecode 读取: cv2.imread 在 Windows 上不支持非 ASCII 路径
         buf = np.frombuffer(path.read_bytes(), np.uint8)
-        img = cv2.imdecode(buf, cv2.IMREAD_UNCHANGED)
-        result[page_type] = img > 0
+        img = cv2.imdecode(buf, cv2.IMREAD_GRAYSCALE)
+        result[page_type] = _pack(img > 0)
     return result
 
 
-# 模块级缓存 — 首次调用时加载
-@lru_cache(maxsize=1)
+def _preload_templates() -> Future[dict[TabbedPageType, np.ndarray]]:
+    """在后台线程开始加载参考模板。
+
+    导入模块时即提交，PNG 解码与启动阶段的其他工作重叠，
+    首次识别时通常已加载完毕。执行器提交后立即关闭，工作线程
+    完成加载即退出。
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tabbed-templates')
+    try:
+        return executor.submit(_load_templates)
+    finally:
+        executor.shutdown(wait=False)
+
+
+_templates_future = _preload_templates()
+"""参考模板的后台加载结果 (模块导入时提交)。"""
+
+
 def _get_templates() -> dict[TabbedPageType, np.ndarray]:
-    """获取参考模板 (懒加载 + 缓存)。"""
-    return _load_templates()
+    """获取参考模板 (后台预加载，必要时阻塞等待)。"""
+    return _templates_future.result()
+
+
+@lru_cache(maxsize=1)
+def _ranked_templates() -> tuple[tuple[int, TabbedPageType, np.ndarray, int], ...]:
+    """参考模板按白色像素数降序排列: ``(原顺序, 类型, 打包模板, 白色像素数)``。
+
+    对任一测试图像，模板 ``t`` 的覆盖度上界为
+    ``min(test_pop, pop[t]) / test_pop``，随 ``pop[t]`` 单调不减，
+    因此该顺序即上界降序，供 :func:`_match_page_type` 剪枝。
+    """
+    ranked = [
+        (rank, page_type, tmpl, _popcount(tmpl))
+        for rank, (page_type, tmpl) in enumerate(_get_templates().items())
+    ]
+    ranked.sort(key=lambda item: item[3], reverse=True)
+    return tuple(ranked)
 
 
 def _binarize_tabbar(screen: np.ndarray) -> np.ndarray:
-    """将截图标签栏区域二值化并缩放到标准尺寸。
+    """将截图标签栏区域缩放到标准尺寸并二值化。
 
     步骤:
 
     1. 裁剪顶部 7.5%、左侧 63% (标签栏区域)
-    2. 转灰度
-    3. 自适应阈值二值化 (高斯, blockSize=21, C=-5)
-    4. 缩放到 600x40 (最近邻插值)
+    2. 缩放到 600x40 (最近邻插值)
+    3. 转灰度
+    4. 自适应阈值二值化 (高斯, blockSize=21, C=-5)
+
+    先缩放再二值化: 自适应阈值的开销与像素数成正比，高分辨率截图上
+    可省去数倍计算。最近邻缩放保留笔画锐利边缘，与参考模板的生成方式
+    (960x540 下裁剪区域本身即约为标准尺寸) 一致；面积插值会模糊笔画，
+    反而降低覆盖度且更慢。
 
     Parameters
     ----------
@@ -212,7 +293,8 @@ def _binarize_tabbar(screen: np.ndarray) -> np.ndarray:
     """
     h, w = screen.shape[:2]
     crop = screen[0 : int(h * _CROP_Y), 0 : int(w * _CROP_X)]
-    gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(crop, (_REF_W, _REF_H), interpolation=cv2.INTER_NEAREST)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
     binary = cv2.adaptiveThreshold(
         gray,
         255,
@@ -221,11 +303,10 @@ def _binarize_tabbar(screen: np.ndarray) -> np.ndarray:
         _ADAPTIVE_BLOCK,
         _ADAPTIVE_C,
     )
-    resized = cv2.resize(binary, (_REF_W, _REF_H), interpolation=cv2.INTER_NEAREST)
-    return resized > 0
+    return binary > 0
 
 
-def _coverage(test: np.ndarray, template: np.ndarray) -> float:
+def _coverage(test: np.ndarray, template: np.ndarray, test_pop: int) -> float:
     """计算覆盖度: 测试图像白色像素中有多少在模板中也是白色。
 
     ``coverage = |test ∩ template| / |test|``
@@ -233,26 +314,38 @@ def _coverage(test: np.ndarray, template: np.ndarray) -> float:
     Parameters
     ----------
     test:
-        测试图像布尔数组。
+        测试图像打包数组。
     template:
-        参考模板布尔数组。
+        参考模板打包数组。
+    test_pop:
+        ``test`` 的白色像素数 (同一截图对各模板只计算一次)。
 
     Returns
     -------
     float
         覆盖度 [0.0, 1.0]。
     """
-    test_sum = int(test.sum())
-    if test_sum == 0:
+    if test_pop == 0:
         return 0.0
-    return float((test & template).sum()) / test_sum
+    return _popcount(test & template) / test_pop
+
+
+_last_match: TabbedPageType | None = None
+"""上一次模板匹配的结果，供 :func:`_match_page_type` 优先比较。"""
 
 
 def _match_page_type(screen: np.ndarray) -> TabbedPageType | None:
     """通过模板匹配识别标签页面类型。
 
     对标签栏区域二值化后，与 5 个参考模板逐一比较覆盖度，
-    取最高者。
+    取最高者 (并列时取模板原顺序靠前者)。
+
+    模板按覆盖度上界降序比较，一旦上界不超过 :data:`_MIN_COVERAGE`
+    或低于当前最佳分数即停止 — 剩余模板不可能胜出，结果与穷举一致。
+
+    连续截图通常停留在同一页面，因此先以上一次匹配到的模板的分数作为
+    初始最佳分数，使剪枝更早生效; 其余模板仍按上界逐一判定，结果不受
+    调用历史影响。
 
     Parameters
     ----------
@@ -264,18 +357,39 @@ def _match_page_type(screen: np.ndarray) -> TabbedPageType | None:
     TabbedPageType | None
         覆盖度最高的页面类型，无模板时返回 ``None``。
     """
-    templates = _get_templates()
-    if not templates:
+    ranked = _ranked_templates()
+    if not ranked:
+        return None
+
+    test = _pack(_binarize_tabbar(screen))
+    test_pop = _popcount(test)
+    if test_pop == 0:
         return None
 
-    test_bin = _binarize_tabbar(screen)
+    global _last_match  # noqa: PLW0603
     best_type: TabbedPageType | None = None
     best_score = -1.0
-    for page_type, tmpl in templates.items():
-        score = _coverage(test_bin, tmpl)
-        if score > 0.6 and score > best_score:
+    best_rank = len(ranked)
+    seed = next((item for item in ranked if item[1] == _last_match), None)
+    if seed is not None:
+        seed_score = _coverage(test, seed[2], test_pop)
+        if seed_score > _MIN_COVERAGE:
+            best_rank, best_type, best_score = seed[0], seed[1], seed_score
+    for rank, page_type, tmpl, tmpl_pop in ranked:
+        if seed is not None and page_type == seed[1]:
+            continue
+        bound = min(test_pop, tmpl_pop) / test_pop
+        if bound <= _MIN_COVERAGE or bound < best_score:
+            break
+        score = _coverage(test, tmpl, test_pop)
+        if score > _MIN_COVERAGE and (
+            score > best_score or (score == best_score and rank < best_rank)
+        ):
             best_score = score
             best_type = page_type
+            best_rank = rank
+    if best_type is not None:
+        _last_match = best_type
     return best_type
 
 
@@ -284,6 +398,32 @@ def _match_page_type(screen: np.ndarray) -> TabbedPageType | None:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+@lru_cache(maxsize=4)
+def _tab_probe_index(h: int, w: int) -> tuple[np.ndarray, np.ndarray]:
+    """标签栏探测点在 ``h x w`` 截图上的绝对 (行, 列) 索引 (按分辨率缓存)。"""
+    rows = (_TAB_PROBE_XY[:, 1] * h).astype(np.intp)
+    cols = (_TAB_PROBE_XY[:, 0] * w).astype(np.intp)
+    rows.flags.writeable = False
+    cols.flags.writeable = False
+    return rows, cols
+
+
+def _sample_tab_probes(screen: np.ndarray) -> np.ndarray:
+    """一次取出全部标签栏探测点像素，返回 (N, 3) uint8。"""
+    return screen[_tab_probe_index(*screen.shape[:2])]
+
+
+def _blue_mask(pixels: np.ndarray) -> np.ndarray:
+    """各探测点是否为激活蓝色 (欧几里得距离 ≤ 容差)。"""
+    diff = pixels.astype(np.int32) - _TAB_BLUE_RGB
+    return (diff * diff).sum(axis=1) <= _TAB_BLUE_TOL_SQ
+
+
+def _dark_mask(pixels: np.ndarray) -> np.ndarray:
+    """各探测点是否为暗色 (所有通道 < :data:`TAB_DARK_MAX`)。"""
+    return cv2.inRange(pixels.reshape(-1, 1, 3), _TAB_DARK_LO, _TAB_DARK_HI).ravel() > 0
+
+
 def is_tabbed_page(screen: np.ndarray) -> bool:
     """判断截图是否为标签页面 (地图/建造/强化/任务 之一)。
 
@@ -294,23 +434,20 @@ def is_tabbed_page(screen: np.ndarray) -> bool:
     screen:
         截图 (HxWx3, RGB)。
     """
-    blue_count = 0
-    dark_count = 0
-    for _i, (x, y) in enumerate(TAB_PROBES):
-        pixel = PixelChecker.get_pixel(screen, x, y)
-        is_blue = pixel.near(TAB_BLUE, TAB_BLUE_TOLERANCE)
-        is_dark = max(pixel.r, pixel.g, pixel.b) < TAB_DARK_MAX
-        # _log.debug(
-        #     '[TabCheck] probe[{}] ({:.4f},{:.4f}) → ({},{},{}) blue={} dark={}',
-        #     i, x, y, pixel.r, pixel.g, pixel.b, is_blue, is_dark,
-        # )
-        if is_blue:
-            blue_count += 1
-        elif is_dark:
-            dark_count += 1
-    result = blue_count == 1 and dark_count == len(TAB_PROBES) - 1
-    # _log.debug('[TabCheck] blue={} dark={} → is_tabbed={}', blue_count, dark_count, result)
-    return result
+    # 短路: 首个探测点既不蓝也不暗即可判否。多数截图并非标签页，
+    # 单点标量判断远比整组向量化判定便宜
+    rows, cols = _tab_probe_index(*screen.shape[:2])
+    r, g, b = screen[rows[0], cols[0]].tolist()
+    if max(r, g, b) >= TAB_DARK_MAX and (
+        (r - TAB_BLUE.r) ** 2 + (g - TAB_BLUE.g) ** 2 + (b - TAB_BLUE.b) ** 2 > _TAB_BLUE_TOL_SQ
+    ):
+        return False
+
+    pixels = _sample_tab_probes(screen)
+    is_blue = _blue_mask(pixels)
+    # 蓝色优先: 既蓝又暗的点只计为蓝色
+    is_dark = _dark_mask(pixels) & ~is_blue
+    return bool(is_blue.sum() == 1 and is_dark.sum() == len(TAB_PROBES) - 1)
 
 
 def get_active_tab_index(screen: np.ndarray) -> int | None:
@@ -326,10 +463,72 @@ def get_active_tab_index(screen: np.ndarray) -> int | None:
     int | None
         蓝色探测点的索引 (0-4)，未找到返回 ``None``。
     """
-    for i, (x, y) in enumerate(TAB_PROBES):
-        if PixelChecker.get_pixel(screen, x, y).near(TAB_BLUE, TAB_BLUE_TOLERANCE):
-            return i
-    return None
+    hits = np.flatnonzero(_blue_mask(_sample_tab_probes(screen)))
+    return int(hits[0]) if hits.size else None
+
+
+@dataclass(frozen=True, slots=True)
+class TabbarState:
+    """一帧截图的标签栏识别结果。"""
+
+    is_tabbed: bool
+    """标签栏探测是否通过 (1 蓝 + 4 暗)。"""
+    page_type: TabbedPageType | None = None
+    """模板匹配得到的页面类型，非标签页或匹配失败为 ``None``。"""
+    active_tab: int | None = None
+    """激活标签索引 (0-4)，非标签页为 ``None``。"""
+
+
+_NOT_TABBED = TabbarState(is_tabbed=False)
+
+_CLASSIFY_CACHE_SIZE: int = 2
+"""按帧缓存的识别结果条数 (当前帧 + 上一帧)。"""
+
+_classify_cache: deque[tuple[np.ndarray, TabbarState]] = deque(maxlen=_CLASSIFY_CACHE_SIZE)
+"""``(截图, 识别结果)``，按对象身份匹配；持有引用以免 ``id`` 被复用。"""
+
+
+def classify(screen: np.ndarray) -> TabbarState:
+    """一次性识别截图的标签栏状态。
+
+    依次执行标签栏探测、模板匹配与激活标签定位，结果供
+    :func:`identify_page_type` 与各 checker 共用。
+
+    Parameters
+    ----------
+    screen:
+        截图 (HxWx3, RGB)。
+
+    Returns
+    -------
+    TabbarState
+        标签栏识别结果。
+
+    Notes
+    -----
+    一次 :func:`~autowsgr.ui.page.get_current_page` 会让 5 个标签页面的
+    识别器对同一帧各调用一次；``wait_for_page`` 每轮也只截一帧交给
+    checker。只读截图 (控制器返回的帧) 按对象身份缓存最近
+    :data:`_CLASSIFY_CACHE_SIZE` 帧的结果，同一帧只二值化、匹配一次；
+    可写数组可能被原地修改，不缓存。
+    """
+    cacheable = not screen.flags.writeable
+    if cacheable:
+        for cached, state in tuple(_classify_cache):
+            if cached is screen:
+                return state
+
+    if is_tabbed_page(screen):
+        state = TabbarState(
+            is_tabbed=True,
+            page_type=_match_page_type(screen),
+            active_tab=get_active_tab_index(screen),
+        )
+    else:
+        state = _NOT_TABBED
+    if cacheable:
+        _classify_cache.append((screen, state))
+    return state
 
 
 def identify_page_type(screen: np.ndarray) -> TabbedPageType | None:
@@ -350,10 +549,7 @@ def identify_page_type(screen: np.ndarray) -> TabbedPageType | None:
     TabbedPageType | None
         页面类型，非标签页返回 ``None``。
     """
-    if not is_tabbed_page(screen):
-        return None
-
-    return _match_page_type(screen)
+    return classify(screen).page_type
 
 
 def make_tab_checker(
@@ -375,7 +571,8 @@ def make_tab_checker(
     """
 
     def _check(screen: np.ndarray) -> bool:
-        return identify_page_type(screen) == page_type and get_active_tab_index(screen) == tab_index
+        state = classify(screen)
+        return state.page_type == page_type and state.active_tab == tab_index
 
     return _check
 
@@ -392,6 +589,6 @@ def make_page_checker(
     """
 
     def _check(screen: np.ndarray) -> bool:
-        return identify_page_type(screen) == page_type
+        return classify(screen).page_type == page_type
 
     return _check
@@ -7,9 +7,11 @@ from .navigation import (
     DEFAULT_NAV_CONFIG,
     NavConfig,
     NavigationError,
+    click_and_wait_for_any,
     click_and_wait_for_page,
     click_and_wait_leave_page,
     confirm_operation,
+    wait_for_any,
     wait_for_page,
     wait_leave_page,
 )
@@ -30,12 +32,14 @@ __all__ = [
     'LEGACY_WIDTH',
     'NavConfig',
     'NavigationError',
+    'click_and_wait_for_any',
     'click_and_wait_for_page',
     'click_and_wait_leave_page',
     'confirm_operation',
     'locate_ship_rows',
     'recognize_ships_in_list',
     'to_legacy_format',
+    'wait_for_any',
     'wait_for_page',
     'wait_leave_page',
 ]
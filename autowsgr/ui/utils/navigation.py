@@ -4,8 +4,9 @@
 
 - **NavigationError** — 导航验证失败异常
 - **NavConfig / DEFAULT_NAV_CONFIG** — 导航操作参数
-- **wait_for_page / wait_leave_page** — 底层截图轮询
-- **click_and_wait_for_page / click_and_wait_leave_page** — 带重试的一步导航
+- **wait_for_page / wait_for_any / wait_leave_page** — 底层截图轮询
+- **click_and_wait_for_page / click_and_wait_for_any / click_and_wait_leave_page**
+  — 带重试的一步导航
 - **confirm_operation** — 确认弹窗点击
 """
 
@@ -15,12 +16,12 @@ import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from autowsgr.infra.logger import get_logger
+from autowsgr.infra.logger import get_logger, level_enabled
 from autowsgr.vision import ImageChecker
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     import numpy as np
 
@@ -29,6 +30,8 @@ if TYPE_CHECKING:
 
 _log = get_logger('ui')
 
+_NS_PER_SEC = 1_000_000_000
+
 # ---------------------------------------------------------------------------
 # 异常
 # ---------------------------------------------------------------------------
@@ -97,6 +100,9 @@ def wait_for_page(
 
     内置浮层消除。遇到可消除浮层时立即处理并继续轮询（不计入睡眠延迟）。
 
+    未匹配时识别当前页面仅用于日志与超时报错，因此只在 DEBUG 日志开启
+    或已超时时执行，并跳过刚刚失败的 ``checker``。
+
     Raises
     ------
     NavigationError
@@ -104,7 +110,7 @@ def wait_for_page(
     """
     from autowsgr.ui.page import get_current_page
 
-    deadline = time.monotonic() + timeout
+    deadline_ns = time.monotonic_ns() + int(timeout * _NS_PER_SEC)
     attempt = 0
     _log.debug('[UI] 等待到达: {} -> {} (超时 {:.1f}s)', source or '?', target or '?', timeout)
 
@@ -118,16 +124,18 @@ def wait_for_page(
             )
             return screen
 
-        current = get_current_page(screen)
-        _log.debug(
-            '[UI] 等待 #{}: {} -> {}, 当前={}',
-            attempt,
-            source or '?',
-            target or '?',
-            current or '未知',
-        )
+        timed_out = time.monotonic_ns() >= deadline_ns
+        if timed_out or level_enabled('DEBUG'):
+            current = get_current_page(screen, skip=checker)
+            _log.debug(
+                '[UI] 等待 #{}: {} -> {}, 当前={}',
+                attempt,
+                source or '?',
+                target or '?',
+                current or '未知',
+            )
 
-        if time.monotonic() >= deadline:
+        if timed_out:
             msg = (
                 f'等待超时: {source or "?"} -> {target or "?"}, '
                 f'{attempt} 次截图后仍未到达, 当前: {current or "未知"}'
@@ -138,6 +146,79 @@ def wait_for_page(
         time.sleep(interval)
 
 
+def wait_for_any(
+    ctrl: AndroidController,
+    checkers: Mapping[str, Callable[[np.ndarray], bool]],
+    *,
+    timeout: float = DEFAULT_NAV_CONFIG.timeout,
+    interval: float = DEFAULT_NAV_CONFIG.interval,
+    handle_overlays: bool = True,  # noqa: ARG001
+    source: str = '',
+) -> tuple[str, np.ndarray]:
+    """反复截图，直到 ``checkers`` 中任一返回 ``True``。
+
+    每帧按字典顺序评估全部 checker，返回第一个匹配项。适用于存在多种
+    可接受结果的分支流程 (如 确认弹窗 / 直接跳转)，一个轮询循环代替
+    多次串行 :func:`wait_for_page`。
+
+    Parameters
+    ----------
+    checkers:
+        名称 → 页面判定函数；名称同时用于日志。
+
+    Returns
+    -------
+    tuple[str, np.ndarray]
+        匹配的名称与对应截图。
+
+    Raises
+    ------
+    ValueError
+        ``checkers`` 为空。
+    NavigationError
+        超时仍无任何匹配。
+    """
+    from autowsgr.ui.page import get_current_page
+
+    if not checkers:
+        raise ValueError('checkers 不能为空')
+
+    target = ' | '.join(checkers)
+    deadline_ns = time.monotonic_ns() + int(timeout * _NS_PER_SEC)
+    attempt = 0
+    _log.debug('[UI] 等待到达: {} -> {} (超时 {:.1f}s)', source or '?', target, timeout)
+
+    while True:
+        attempt += 1
+        screen = ctrl.screenshot()
+
+        for name, checker in checkers.items():
+            if checker(screen):
+                _log.debug('[UI] 已到达: {} -> {} (第 {} 次截图)', source or '?', name, attempt)
+                return name, screen
+
+        timed_out = time.monotonic_ns() >= deadline_ns
+        if timed_out or level_enabled('DEBUG'):
+            current = get_current_page(screen)
+            _log.debug(
+                '[UI] 等待 #{}: {} -> {}, 当前={}',
+                attempt,
+                source or '?',
+                target,
+                current or '未知',
+            )
+
+        if timed_out:
+            msg = (
+                f'等待超时: {source or "?"} -> {target}, '
+                f'{attempt} 次截图后仍未到达, 当前: {current or "未知"}'
+            )
+            _log.error('[UI] {}', msg)
+            raise NavigationError(msg, screen=screen)
+
+        time.sleep(interval)
+
+
 def wait_leave_page(
     ctrl: AndroidController,
     checker: Callable[[np.ndarray], bool],
@@ -147,11 +228,18 @@ def wait_leave_page(
     handle_overlays: bool = True,  # noqa: ARG001
     source: str = '',
     target: str = '',
+    initial_delay: float = 0.0,
 ) -> np.ndarray:
     """反复截图，直到 ``checker`` 返回 ``False`` (已离开)。
 
     目标页面签名未采集时的降级方案。优先使用 :func:`wait_for_page`。
 
+    Parameters
+    ----------
+    initial_delay:
+        首次截图前的等待 (秒)，用于刚点击后给画面留出响应时间，
+        不计入 *timeout*。
+
     Raises
     ------
     NavigationError
@@ -159,7 +247,9 @@ def wait_leave_page(
     """
     from autowsgr.ui.page import get_current_page
 
-    deadline = time.monotonic() + timeout
+    if initial_delay > 0:
+        time.sleep(initial_delay)
+    deadline_ns = time.monotonic_ns() + int(timeout * _NS_PER_SEC)
     attempt = 0
     _log.debug('[UI] 等待离开: {} -> {} (超时 {:.1f}s)', source or '?', target or '?', timeout)
 
@@ -168,19 +258,20 @@ def wait_leave_page(
         screen = ctrl.screenshot()
 
         if not checker(screen):
-            current = get_current_page(screen)
-            _log.debug(
+            # 到达页面仅用于日志: lazy 模式下 DEBUG 被过滤时不执行识别，
+            # 且原页面 checker 刚返回 False，无需再跑一遍
+            _log.opt(lazy=True).debug(
                 '[UI] 已离开: {} -> {} (第 {} 次截图, 到达={})',
-                source or '?',
-                target or '?',
-                attempt,
-                current or '未知',
+                lambda: source or '?',
+                lambda: target or '?',
+                lambda n=attempt: n,
+                lambda s=screen: get_current_page(s, skip=checker) or '未知',
             )
             return screen
 
         _log.debug('[UI] 等待离开 #{}: 仍在 {}', attempt, source or '?')
 
-        if time.monotonic() >= deadline:
+        if time.monotonic_ns() >= deadline_ns:
             msg = (
                 f'离开超时: {source or "?"} -> {target or "?"}, '
                 f'{attempt} 次截图后仍在 {source or "?"}'
@@ -225,6 +316,40 @@ def click_and_wait_for_page(
     )
 
 
+def click_and_wait_for_any(
+    ctrl: AndroidController,
+    click_coord: tuple[float, float],
+    checkers: Mapping[str, Callable[[np.ndarray], bool]],
+    *,
+    source: str = '',
+    config: NavConfig = DEFAULT_NAV_CONFIG,
+) -> tuple[str, np.ndarray]:
+    """点击 + 等待到达多个候选页面之一。
+
+    分支流程 (点击后可能出现确认弹窗，也可能直接跳转) 使用，
+    见 :func:`wait_for_any`。
+
+    Returns
+    -------
+    tuple[str, np.ndarray]
+        匹配的名称与对应截图。
+
+    Raises
+    ------
+    NavigationError
+        点击后未到达任何候选页面。
+    """
+    ctrl.click(*click_coord)
+    return wait_for_any(
+        ctrl,
+        checkers,
+        timeout=config.timeout,
+        interval=config.interval,
+        handle_overlays=config.handle_overlays,
+        source=source,
+    )
+
+
 # ---------------------------------------------------------------------------
 # 确认弹窗操作 (Legacy confirm_operation 风格)
 # ---------------------------------------------------------------------------
@@ -270,7 +395,7 @@ def confirm_operation(
     from autowsgr.image_resources import Templates
 
     confirm_templates = Templates.Confirm.all()
-    deadline = time.monotonic() + max(timeout, 0)
+    deadline_ns = time.monotonic_ns() + int(max(timeout, 0) * _NS_PER_SEC)
 
     while True:
         screen = ctrl.screenshot()
@@ -298,7 +423,7 @@ def confirm_operation(
             time.sleep(delay)
             return True
 
-        if time.monotonic() >= deadline:
+        if time.monotonic_ns() >= deadline_ns:
             break
         time.sleep(0.3)
 
@@ -321,6 +446,9 @@ def click_and_wait_leave_page(
     目标页面签名未采集时的降级版本。
     优先使用 :func:`click_and_wait_for_page`。
 
+    重试时 ``retry_delay`` 放在点击 **之后**、首次截图之前，
+    避免首帧截到尚未响应点击的旧画面。
+
     Raises
     ------
     NavigationError
@@ -338,7 +466,6 @@ def click_and_wait_leave_page(
                 target or '?',
                 config.retry_delay,
             )
-            time.sleep(config.retry_delay)
 
         ctrl.click(*click_coord)
 
@@ -351,6 +478,7 @@ def click_and_wait_leave_page(
                 handle_overlays=config.handle_overlays,
                 source=source,
                 target=target,
+                initial_delay=config.retry_delay if attempt > 1 else 0.0,
             )
         except NavigationError as e:
             last_err = e
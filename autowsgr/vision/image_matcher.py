@@ -16,6 +16,9 @@
 
 from __future__ import annotations
 
+import threading
+import weakref
+from collections import OrderedDict, deque
 from typing import TYPE_CHECKING
 
 import cv2
@@ -44,6 +47,107 @@ TEMPLATE_SOURCE_RESOLUTION: tuple[int, int] = (960, 540)
 
 _log = get_logger('vision.image')
 
+_GRAY_CACHE_SIZE: int = 2
+"""按帧缓存灰度裁切的截图数 (当前帧 + 上一帧)。"""
+
+_gray_cache: deque[tuple[np.ndarray, dict[tuple[int, int, int, int], np.ndarray]]] = deque(
+    maxlen=_GRAY_CACHE_SIZE
+)
+"""``(截图, {ROI 像素边界: 灰度裁切})``，按对象身份匹配；持有引用以免 ``id`` 被复用。"""
+
+
+def _gray_crop(screen: np.ndarray, bounds: tuple[int, int, int, int]) -> np.ndarray:
+    """按 ROI 像素边界 ``(px1, py1, px2, py2)`` 裁切并转为灰度图。
+
+    同一帧上多条规则、多个模板常在同一 ROI 上匹配。只读截图
+    (控制器返回的帧) 按对象身份缓存各 ROI 的灰度裁切，同一帧同一区域
+    只转换一次；可写数组可能被原地修改，每次重新计算。
+    """
+    px1, py1, px2, py2 = bounds
+    if screen.flags.writeable:
+        return cv2.cvtColor(screen[py1:py2, px1:px2], cv2.COLOR_RGB2GRAY)
+
+    crops = next((c for cached, c in tuple(_gray_cache) if cached is screen), None)
+    if crops is None:
+        crops = {}
+        _gray_cache.append((screen, crops))
+
+    gray = crops.get(bounds)
+    if gray is None:
+        h, w = screen.shape[:2]
+        full = crops.get((0, 0, w, h))
+        if full is not None:
+            gray = full[py1:py2, px1:px2]
+        else:
+            gray = cv2.cvtColor(screen[py1:py2, px1:px2], cv2.COLOR_RGB2GRAY)
+        crops[bounds] = gray
+    return gray
+
+
+_MATCH_CACHE_SIZE: int = 256
+"""模板匹配结果缓存的最大条数。"""
+
+_MATCH_CACHE_MAX_AREA_RATIO: int = 256
+"""搜索区域面积超过模板面积的该倍数时不缓存 (跳过区域内容的拷贝与哈希)。"""
+
+_match_cache: OrderedDict[tuple, tuple[weakref.ref[ImageTemplate], float, tuple[int, int]]] = (
+    OrderedDict()
+)
+"""``键 → (模板弱引用, 最佳分数, 局部最佳位置)``，LRU 顺序。
+
+键中的 ``id(template)`` 在模板被回收后可能被新模板复用，命中时须校验
+弱引用仍指向同一模板。
+"""
+
+_match_cache_lock = threading.Lock()
+
+
+def _best_match(
+    screen_gray: np.ndarray,
+    template_gray: np.ndarray,
+    template: ImageTemplate,
+    method: int,
+) -> tuple[float, tuple[int, int]]:
+    """在灰度搜索区域中匹配模板，返回 ``(最佳分数, 搜索区域内的最佳左上角)``。
+
+    顶栏、菜单等 ROI 在轮询的连续帧间往往不变。结果以
+    ``(模板, 方法, 模板尺寸, 区域尺寸, 区域内容哈希)`` 为键缓存，
+    内容未变时跳过 ``cv2.matchTemplate``。搜索区域远大于模板时
+    (见 :data:`_MATCH_CACHE_MAX_AREA_RATIO`) 不缓存，免去整块区域的拷贝与哈希。
+    """
+    key = None
+    if screen_gray.size <= _MATCH_CACHE_MAX_AREA_RATIO * template_gray.size:
+        key = (
+            id(template),
+            method,
+            template_gray.shape,
+            screen_gray.shape,
+            hash(screen_gray.tobytes()),
+        )
+        with _match_cache_lock:
+            entry = _match_cache.get(key)
+            if entry is not None and entry[0]() is template:
+                _match_cache.move_to_end(key)
+                return entry[1], entry[2]
+
+    result = cv2.matchTemplate(screen_gray, template_gray, method)
+    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+
+    if method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED):
+        best_val = 1.0 - min_val if method == cv2.TM_SQDIFF_NORMED else min_val
+        best_loc = min_loc
+    else:
+        best_val = max_val
+        best_loc = max_loc
+
+    if key is not None:
+        with _match_cache_lock:
+            _match_cache[key] = (weakref.ref(template), best_val, best_loc)
+            _match_cache.move_to_end(key)
+            if len(_match_cache) > _MATCH_CACHE_SIZE:
+                _match_cache.popitem(last=False)
+    return best_val, best_loc
+
 
 class ImageChecker:
     """基于模板匹配的图像检测引擎。
@@ -103,6 +207,31 @@ class ImageChecker:
         scaled = cv2.resize(template_img, (new_w, new_h), interpolation=interp)
         return scaled
 
+    @staticmethod
+    def _template_gray(template: ImageTemplate, screen_w: int, screen_h: int) -> np.ndarray:
+        """取适配截图分辨率的灰度模板。
+
+        分辨率与采集分辨率一致时直接返回 :attr:`ImageTemplate.image_gray`；
+        否则先缩放 RGB 模板再转灰度 (与逐次计算结果一致)，
+        并按截图尺寸缓存在模板上。
+        """
+        src_w, src_h = template.source_resolution or TEMPLATE_SOURCE_RESOLUTION
+        if screen_w == src_w and screen_h == src_h:
+            return template.image_gray
+
+        cache = template._scaled_gray_cache
+        gray = cache.get((screen_w, screen_h))
+        if gray is None:
+            scaled = ImageChecker._scale_template_if_needed(
+                template.image,
+                screen_w,
+                screen_h,
+                source_resolution=template.source_resolution,
+            )
+            gray = cv2.cvtColor(scaled, cv2.COLOR_RGB2GRAY)
+            cache[(screen_w, screen_h)] = gray
+        return gray
+
     # ── 核心匹配 ──
 
     @staticmethod
@@ -120,17 +249,13 @@ class ImageChecker:
         h, w = screen.shape[:2]
         roi = roi or ROI.full()
 
-        cropped = roi.crop(screen)
-        ch, cw = cropped.shape[:2]
+        ox, oy, _, _ = bounds = roi.to_absolute(w, h)
+        screen_gray = _gray_crop(screen, bounds)
+        ch, cw = screen_gray.shape[:2]
 
         # 分辨率适配：按截图实际尺寸缩放模板（使用模板自身的采集分辨率）
-        tmpl_img = ImageChecker._scale_template_if_needed(
-            template.image,
-            w,
-            h,
-            source_resolution=template.source_resolution,
-        )
-        th, tw_ = tmpl_img.shape[:2]
+        template_gray = ImageChecker._template_gray(template, w, h)
+        th, tw_ = template_gray.shape[:2]
 
         if th > ch or tw_ > cw:
             _log.trace(
@@ -143,18 +268,7 @@ class ImageChecker:
             )
             return None
 
-        screen_gray = cv2.cvtColor(cropped, cv2.COLOR_RGB2GRAY)
-        template_gray = cv2.cvtColor(tmpl_img, cv2.COLOR_RGB2GRAY)
-        result = cv2.matchTemplate(screen_gray, template_gray, method)
-
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-
-        if method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED):
-            best_val = 1.0 - min_val if method == cv2.TM_SQDIFF_NORMED else min_val
-            best_loc = min_loc
-        else:
-            best_val = max_val
-            best_loc = max_loc
+        best_val, best_loc = _best_match(screen_gray, template_gray, template, method)
 
         if best_val < confidence:
             _log.trace(
@@ -166,8 +280,8 @@ class ImageChecker:
             return None
 
         local_x, local_y = best_loc
-        abs_x = int(roi.x1 * w) + local_x
-        abs_y = int(roi.y1 * h) + local_y
+        abs_x = ox + local_x
+        abs_y = oy + local_y
         rel_x1, rel_y1 = abs_x / w, abs_y / h
         rel_x2, rel_y2 = (abs_x + tw_) / w, (abs_y + th) / h
         rel_cx, rel_cy = (rel_x1 + rel_x2) / 2, (rel_y1 + rel_y2) / 2
@@ -187,6 +301,13 @@ class ImageChecker:
             bottom_right=(rel_x2, rel_y2),
         )
 
+    @staticmethod
+    def clear_cache() -> None:
+        """清空按帧灰度裁切缓存与模板匹配结果缓存。"""
+        _gray_cache.clear()
+        with _match_cache_lock:
+            _match_cache.clear()
+
     # ── 规则匹配 ──
 
     @staticmethod
@@ -382,23 +503,17 @@ class ImageChecker:
         """
         h, w = screen.shape[:2]
         roi = roi or ROI.full()
-        cropped = roi.crop(screen)
-        ch, cw = cropped.shape[:2]
+        ox, oy, _, _ = bounds = roi.to_absolute(w, h)
+        screen_gray = _gray_crop(screen, bounds)
+        ch, cw = screen_gray.shape[:2]
 
         # 分辨率适配（使用模板自身的采集分辨率）
-        tmpl_img = ImageChecker._scale_template_if_needed(
-            template.image,
-            w,
-            h,
-            source_resolution=template.source_resolution,
-        )
-        th, tw_ = tmpl_img.shape[:2]
+        template_gray = ImageChecker._template_gray(template, w, h)
+        th, tw_ = template_gray.shape[:2]
 
         if th > ch or tw_ > cw:
             return []
 
-        screen_gray = cv2.cvtColor(cropped, cv2.COLOR_RGB2GRAY)
-        template_gray = cv2.cvtColor(tmpl_img, cv2.COLOR_RGB2GRAY)
         result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
 
         locations = np.where(result >= confidence)
@@ -406,25 +521,29 @@ class ImageChecker:
         if len(scores) == 0:
             return []
 
-        sorted_indices = np.argsort(-scores)
+        # 按分数降序贪心选取，每选中一个即一次性抑制其 min_distance
+        # (切比雪夫距离) 内的所有候选，Python 循环次数只与结果数有关
+        order = np.argsort(-scores)
+        xs, ys = locations[1][order], locations[0][order]
+        cxs, cys = xs + tw_ // 2, ys + th // 2
+        alive = np.ones(len(order), dtype=bool)
         details: list[ImageMatchDetail] = []
-        used: list[tuple[int, int]] = []
 
-        for idx in sorted_indices:
-            if len(details) >= max_count:
+        pos = 0
+        while len(details) < max_count and pos < len(order):
+            k = pos + int(np.argmax(alive[pos:]))
+            if not alive[k]:
                 break
-            lx, ly = int(locations[1][idx]), int(locations[0][idx])
-            cx, cy = lx + tw_ // 2, ly + th // 2
-            if any(abs(cx - ux) < min_distance and abs(cy - uy) < min_distance for ux, uy in used):
-                continue
-            used.append((cx, cy))
-            ax, ay = int(roi.x1 * w) + lx, int(roi.y1 * h) + ly
+            alive &= (np.abs(cxs - cxs[k]) >= min_distance) | (np.abs(cys - cys[k]) >= min_distance)
+            pos = k + 1
+
+            ax, ay = ox + int(xs[k]), oy + int(ys[k])
             rx1, ry1 = ax / w, ay / h
             rx2, ry2 = (ax + tw_) / w, (ay + th) / h
             details.append(
                 ImageMatchDetail(
                     template_name=template.name,
-                    confidence=float(scores[idx]),
+                    confidence=float(scores[order[k]]),
                     center=((rx1 + rx2) / 2, (ry1 + ry2) / 2),
                     top_left=(rx1, ry1),
                     bottom_right=(rx2, ry2),
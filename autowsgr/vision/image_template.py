@@ -56,6 +56,13 @@ class ImageTemplate:
     匹配引擎会根据此值与实际截图分辨率的比值动态缩放模板，
     默认 ``(960, 540)``，与全局 :data:`TEMPLATE_SOURCE_RESOLUTION` 一致。
     """
+    image_gray: np.ndarray = field(init=False, repr=False, compare=False)
+    """``image`` 的灰度图 (HxW, uint8)，构造时计算一次，供匹配引擎复用。"""
+    _scaled_gray_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    """匹配引擎的私有缓存 (按截图分辨率缩放后的灰度模板)，不参与比较。"""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'image_gray', cv2.cvtColor(self.image, cv2.COLOR_RGB2GRAY))
 
     # ── 构造 ──
 
@@ -182,7 +189,7 @@ class ImageMatchDetail:
     bottom_right: tuple[float, float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageMatchResult:
     """图像规则匹配结果。
 
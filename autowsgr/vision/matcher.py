@@ -29,7 +29,7 @@ from typing import TYPE_CHECKING
 import cv2
 import numpy as np
 
-from autowsgr.infra.logger import get_logger
+from autowsgr.infra.logger import get_logger, level_enabled
 
 # 从 pixel.py 导入所有数据类型 (保持向后兼容)
 from .pixel import (
@@ -44,7 +44,7 @@ from .pixel import (
 
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
 
 _log = get_logger('vision.pixel')
@@ -72,9 +72,8 @@ class PixelChecker:
             像素的相对坐标（左上角为 0.0，右下角趋近 1.0）。
         """
         h, w = screen.shape[:2]
-        px, py = int(x * w), int(y * h)
-        rgb = screen[py, px]
-        return Color(r=int(rgb[0]), g=int(rgb[1]), b=int(rgb[2]))
+        r, g, b = screen[int(y * h), int(x * w)].tolist()
+        return Color(r=r, g=g, b=b)
 
     @staticmethod
     def check_pixel(
@@ -85,8 +84,10 @@ class PixelChecker:
         tolerance: float = 30.0,
     ) -> bool:
         """检查单个像素是否与期望颜色匹配。"""
-        actual = PixelChecker.get_pixel(screen, x, y)
-        return actual.near(color, tolerance)
+        h, w = screen.shape[:2]
+        r, g, b = screen[int(y * h), int(x * w)].tolist()
+        dr, dg, db = r - color.r, g - color.g, b - color.b
+        return dr * dr + dg * dg + db * db <= tolerance * tolerance
 
     # ── 多像素批量 ──
 
@@ -95,16 +96,29 @@ class PixelChecker:
         screen: np.ndarray,
         positions: Sequence[tuple[float, float]],
     ) -> list[Color]:
-        """批量获取多个坐标的像素颜色。"""
-        return [PixelChecker.get_pixel(screen, x, y) for x, y in positions]
+        """批量获取多个坐标的像素颜色 (一次采样)。"""
+        if len(positions) == 0:
+            return []
+        h, w = screen.shape[:2]
+        rows = [int(y * h) for _, y in positions]
+        cols = [int(x * w) for x, _ in positions]
+        return [Color(r=r, g=g, b=b) for r, g, b in screen[rows, cols].tolist()]
 
     @staticmethod
     def check_pixels(
         screen: np.ndarray,
         rules: Sequence[PixelRule],
     ) -> list[bool]:
-        """批量检查多条像素规则。"""
-        return [PixelChecker.check_pixel(screen, r.x, r.y, r.color, r.tolerance) for r in rules]
+        """批量检查多条像素规则 (一次采样、一次向量比较)。"""
+        if not rules:
+            return []
+        h, w = screen.shape[:2]
+        rows = [int(r.y * h) for r in rules]
+        cols = [int(r.x * w) for r in rules]
+        colors = np.array([r.color.as_rgb_tuple() for r in rules], dtype=np.int32)
+        tol_sq = np.array([r.tolerance * r.tolerance for r in rules], dtype=np.float64)
+        diff = screen[rows, cols].astype(np.int32) - colors
+        return ((diff * diff).sum(axis=1) <= tol_sq).tolist()
 
     # ── 签名匹配 ──
 
@@ -137,6 +151,11 @@ class PixelChecker:
                 with_details=with_details,
             )
 
+        # 逐规则路径仅用于收集详情或 TRACE 逐点日志
+        trace = level_enabled('TRACE')
+        if not with_details and not trace:
+            return PixelChecker._check_vectorized(screen, signature)
+
         details: list[PixelDetail] = []
         matched_count = 0
 
@@ -153,16 +172,17 @@ class PixelChecker:
                     PixelDetail(rule=rule, actual=actual, distance=dist, matched=is_match)
                 )
 
-            _log.trace(
-                "[Matcher] '{}' [{:.4f},{:.4f}] 期望{} 实际{} 距离={:.1f} {}",
-                signature.name,
-                rule.x,
-                rule.y,
-                rule.color.as_rgb_tuple(),
-                actual.as_rgb_tuple(),
-                dist,
-                'OK' if is_match else f'FAIL(容差={rule.tolerance})',
-            )
+            if trace:
+                _log.trace(
+                    "[Matcher] '{}' [{:.4f},{:.4f}] 期望{} 实际{} 距离={:.1f} {}",
+                    signature.name,
+                    rule.x,
+                    rule.y,
+                    rule.color.as_rgb_tuple(),
+                    actual.as_rgb_tuple(),
+                    dist,
+                    'OK' if is_match else f'FAIL(容差={rule.tolerance})',
+                )
 
             # 短路优化
             if signature.strategy == MatchStrategy.ALL and not is_match:
@@ -219,6 +239,92 @@ class PixelChecker:
             details=tuple(details) if with_details else (),
         )
 
+    @staticmethod
+    def _resolve(
+        signature: PixelSignature, shape: tuple[int, ...]
+    ) -> tuple[tuple[np.ndarray, np.ndarray], np.ndarray, np.ndarray]:
+        """按截图分辨率解析签名规则，结果缓存在签名上。
+
+        :meth:`_check_vectorized` 与 :meth:`compile_signatures` 共用此解析，
+        保证两条路径的坐标取整与容差一致。
+
+        Returns
+        -------
+        tuple
+            ``((行索引, 列索引), 期望颜色 (Nx3 int32), 容差平方 (N,))``。
+        """
+        resolved = signature._resolved_cache.get(shape)
+        if resolved is None:
+            h, w = shape
+            rules = signature.rules
+            resolved = (
+                (
+                    np.array([int(r.y * h) for r in rules], dtype=np.intp),
+                    np.array([int(r.x * w) for r in rules], dtype=np.intp),
+                ),
+                np.array([r.color.as_rgb_tuple() for r in rules], dtype=np.int32).reshape(-1, 3),
+                np.array([r.tolerance**2 for r in rules], dtype=np.float64),
+            )
+            signature._resolved_cache[shape] = resolved
+        return resolved
+
+    @staticmethod
+    def _check_vectorized(screen: np.ndarray, signature: PixelSignature) -> PixelMatchResult:
+        """:meth:`check_signature` 的向量化实现 (无详情)。
+
+        规则的像素索引、期望颜色与容差平方按截图分辨率解析一次后缓存在
+        签名上，每次调用只做一次采样与距离平方比较。``matched_count``
+        与逐规则实现的短路语义一致: ALL 计到首个失败为止，ANY 计到首个
+        成功为止。
+        """
+        total = len(signature)
+        index, colors, tol_sq = PixelChecker._resolve(signature, screen.shape[:2])
+
+        diff = screen[index].astype(np.int32) - colors
+        hits = (diff * diff).sum(axis=1) <= tol_sq
+
+        match signature.strategy:
+            case MatchStrategy.ALL:
+                matched = bool(hits.all())
+                # 全部匹配时 argmin 为 0，需单独处理
+                matched_count = total if matched else int(np.argmin(hits))
+                if not matched:
+                    return PixelMatchResult(
+                        matched=False,
+                        signature_name=signature.name,
+                        matched_count=matched_count,
+                        total_count=total,
+                    )
+            case MatchStrategy.ANY:
+                matched = bool(hits.any())
+                matched_count = int(matched)
+                if matched:
+                    return PixelMatchResult(
+                        matched=True,
+                        signature_name=signature.name,
+                        matched_count=matched_count,
+                        total_count=total,
+                    )
+            case MatchStrategy.COUNT:
+                matched_count = int(np.count_nonzero(hits))
+                matched = matched_count >= signature.threshold
+
+        if level_enabled('DEBUG'):
+            _log.debug(
+                "[Matcher] '{}' {} ({}/{} 规则匹配, 策略={})",
+                signature.name,
+                'OK' if matched else 'FAIL',
+                matched_count,
+                total,
+                signature.strategy.value,
+            )
+        return PixelMatchResult(
+            matched=matched,
+            signature_name=signature.name,
+            matched_count=matched_count,
+            total_count=total,
+        )
+
     @staticmethod
     def _check_composite(
         screen: np.ndarray,
@@ -267,6 +373,101 @@ class PixelChecker:
             details=tuple(all_details),
         )
 
+    # ── 编译签名 ──
+
+    @staticmethod
+    def compile_signature(
+        signature: PixelSignature | CompositePixelSignature,
+    ) -> Callable[[np.ndarray], bool]:
+        """将签名编译为专用的布尔检测函数。
+
+        返回的函数与 ``check_signature(screen, signature).matched`` 判定一致，
+        但省去逐规则的属性访问、:class:`Color` 构造与日志调用: 期望颜色与容差
+        在编译时打包为数组，像素索引按截图尺寸计算一次后缓存，每次调用只做
+        一次采样与向量比较。适用于页面识别等高频轮询场景。
+
+        组合签名的各子签名共享同一次采样 (见 :meth:`compile_signatures`)，
+        任一子签名匹配即返回 ``True``。
+
+        Parameters
+        ----------
+        signature:
+            要编译的像素签名（单个或组合）。
+        """
+        if isinstance(signature, CompositePixelSignature):
+            check_all = PixelChecker.compile_signatures(signature.signatures)
+            return lambda screen: any(check_all(screen))
+        check_one = PixelChecker.compile_signatures((signature,))
+        return lambda screen: check_one(screen)[0]
+
+    @staticmethod
+    def compile_signatures(
+        signatures: Sequence[PixelSignature],
+    ) -> Callable[[np.ndarray], list[bool]]:
+        """将多个签名编译为共享采样的批量检测函数。
+
+        所有签名的探测点在编译时去重合并，每帧只对并集做一次采样，
+        各签名再按预计算的偏移从采样结果中取值比较。多个签名共用
+        探测点时 (如同一页面的基础态与各浮层)，采样次数由 N 降为 1。
+
+        Parameters
+        ----------
+        signatures:
+            要编译的像素签名序列。
+
+        Returns
+        -------
+        Callable[[np.ndarray], list[bool]]
+            接收截图，按 *signatures* 顺序返回各签名的匹配结果。
+        """
+        signatures = tuple(signatures)
+        points: dict[tuple[float, float], int] = {}
+        offsets = [
+            np.array([points.setdefault((r.x, r.y), len(points)) for r in sig.rules], dtype=np.intp)
+            for sig in signatures
+        ]
+        n_points = len(points)
+        shape_cache: dict[
+            tuple[int, ...],
+            tuple[
+                tuple[np.ndarray, np.ndarray],
+                list[tuple[np.ndarray, np.ndarray, np.ndarray, MatchStrategy, int]],
+            ],
+        ] = {}
+
+        def _compile(shape: tuple[int, ...]) -> tuple:
+            # 并集索引由各签名的解析结果回填，与 check_signature 共用同一解析
+            rows = np.zeros(n_points, dtype=np.intp)
+            cols = np.zeros(n_points, dtype=np.intp)
+            compiled = []
+            for sig, sig_offsets in zip(signatures, offsets, strict=True):
+                (sig_rows, sig_cols), colors, tol_sq = PixelChecker._resolve(sig, shape)
+                rows[sig_offsets] = sig_rows
+                cols[sig_offsets] = sig_cols
+                compiled.append((sig_offsets, colors, tol_sq, sig.strategy, sig.threshold))
+            return (rows, cols), compiled
+
+        def _check(screen: np.ndarray) -> list[bool]:
+            shape = screen.shape[:2]
+            entry = shape_cache.get(shape)
+            if entry is None:
+                entry = shape_cache[shape] = _compile(shape)
+            index, compiled = entry
+            sampled = screen[index].astype(np.int32)
+            results: list[bool] = []
+            for sig_offsets, colors, tol_sq, strategy, threshold in compiled:
+                diff = sampled[sig_offsets] - colors
+                hits = (diff * diff).sum(axis=1) <= tol_sq
+                if strategy is MatchStrategy.ALL:
+                    results.append(bool(hits.all()))
+                elif strategy is MatchStrategy.ANY:
+                    results.append(bool(hits.any()))
+                else:
+                    results.append(int(np.count_nonzero(hits)) >= threshold)
+            return results
+
+        return _check
+
     @staticmethod
     def identify(
         screen: np.ndarray,
@@ -327,21 +528,23 @@ class PixelChecker:
         tolerance:
             最大容差，超过则返回 None。
         """
-        actual = PixelChecker.get_pixel(screen, x, y)
+        h, w = screen.shape[:2]
+        r, g, b = screen[int(y * h), int(x * w)].tolist()
         best_name: str | None = None
-        best_dist = tolerance + 1.0
+        best_sq = float('inf')
         for name, color in color_map.items():
-            dist = actual.distance(color)
-            if dist < best_dist:
-                best_dist = dist
+            dr, dg, db = r - color.r, g - color.g, b - color.b
+            dist_sq = dr * dr + dg * dg + db * db
+            if dist_sq < best_sq:
+                best_sq = dist_sq
                 best_name = name
-        result_name = best_name if best_dist <= tolerance else None
+        result_name = best_name if best_sq <= tolerance * tolerance else None
         _log.debug(
             '[Matcher] classify_color({:.3f},{:.3f}) → {} (dist={:.1f})',
             x,
             y,
             result_name,
-            best_dist if result_name else -1,
+            best_sq**0.5 if result_name else -1,
         )
         return result_name
 
@@ -14,15 +14,18 @@
 from __future__ import annotations
 
 import os
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import ClassVar
 
 import cv2
-import easyocr
+import numpy as np
 
-from autowsgr.constants import SHIPNAMES, normalize_ship_name
+from autowsgr.constants import SHIPNAMES, normalize_ship_name, ship_names_generation
 from autowsgr.infra.logger import get_logger
 from autowsgr.vision.ocr_rules import (
     EasyOCRProfile,
@@ -34,10 +37,6 @@ from autowsgr.vision.ocr_rules import (
 )
 
 
-if TYPE_CHECKING:
-    import numpy as np
-
-
 _log = get_logger('vision.ocr')
 
 
@@ -45,12 +44,15 @@ _ship_name_match_confidence: float = 0.0
 _MIN_CUSTOM_NAME_BASE_LENGTH = 2
 _MIN_TRUNCATED_OCR_LENGTH = 4
 _MIN_FRAGMENT_OCR_LENGTH = 4
+_FUZZY_MATCH_CACHE_SIZE = 512
+_VECTORIZED_MIN_CANDIDATES = 64
 
 
 def set_ship_name_match_confidence(threshold: float) -> None:
     """设置船池匹配置信度；0 为关闭，其他值限制在 0 到 1。"""
     global _ship_name_match_confidence  # noqa: PLW0603
     _ship_name_match_confidence = max(0.0, min(1.0, threshold))
+    _match_ship_name.cache_clear()
 
 
 # ── 结果数据类 ──
@@ -189,7 +191,7 @@ class OCREngine(ABC):
         if not results:
             _log_fn('[OCR] recognize_single: 无结果')
             return OCRResult(text='', confidence=0.0)
-        best = max(results, key=lambda r: r.confidence)
+        best = max(results, key=attrgetter('confidence'))
         _log_fn("[OCR] recognize_single: '{}' (conf={:.2f})", best.text, best.confidence)
         return best
 
@@ -343,12 +345,11 @@ class OCREngine(ABC):
         _log_fn = _log.debug if self.verbose else _log.trace
         seen: set[str] = set()
         matched: list[str] = []
-        for r in results:
-            text = r.text.strip()
-            if not text:
+        # 重叠检测框常给出相同文本，按文本去重 (保持出现顺序) 后只匹配一次
+        for raw_text in dict.fromkeys(r.text.strip() for r in results):
+            if not raw_text:
                 continue
-            raw_text = text
-            text = apply_ship_patches(text)
+            text = apply_ship_patches(raw_text)
             if text != raw_text:
                 _log_fn(
                     "[OCR] recognize_ship_names: raw='{}' -> patched='{}'",
@@ -367,10 +368,9 @@ class OCREngine(ABC):
                     matched.append(best)
             else:
                 if max_threshold is not None and candidates:
-                    best_candidate = min(candidates, key=lambda c: _edit_distance(text, c))
-                    dist = _edit_distance(text, best_candidate)
+                    dist, nearest = _nearest_candidates(text, candidates)
                     if dist > max_threshold:
-                        raise ShipNameMismatchError(text, best_candidate, dist, max_threshold)
+                        raise ShipNameMismatchError(text, nearest[0], dist, max_threshold)
                 _log_fn("[OCR] recognize_ship_names: '{}' 无匹配 (阈值={})，跳过", text, threshold)
         _log_fn('[OCR] recognize_ship_names: 共识别 {} 艘: {}', len(matched), matched)
         return matched
@@ -379,6 +379,8 @@ class OCREngine(ABC):
 
     _instances: ClassVar[dict[str, OCREngine]] = {}
     """已创建的引擎单例缓存，key 为 ``"<engine>:<gpu>"``。"""
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+    """保护 :attr:`_instances` 的首次创建。"""
 
     @classmethod
     def create(
@@ -402,21 +404,26 @@ class OCREngine(ABC):
         OCREngine
         """
         cache_key = f'{engine}:{gpu}'
-        if cache_key in cls._instances:
+        instance = cls._instances.get(cache_key)
+        if instance is not None:
             _log.debug('[OCR] 复用已有 {} 实例（gpu={}）', engine, gpu)
-            return cls._instances[cache_key]
-
-        if engine == 'easyocr':
-            _log.info('[OCR] 初始化 EasyOCR 引擎（gpu={}, mirror={}）', gpu, mirror)
-            instance = EasyOCREngine(gpu=gpu, mirror=mirror)
-            cls._instances[cache_key] = instance
             return instance
-        if engine == 'fastocr':
-            _log.info('[OCR] 初始化 FastOCR 引擎 (PP-OCRv6-small, CPU)')
-            instance = FastOCREngine()
+
+        # 模型加载耗时数秒，加锁后再次检查，避免多个线程并发首次调用时重复创建
+        with cls._instances_lock:
+            instance = cls._instances.get(cache_key)
+            if instance is not None:
+                return instance
+            if engine == 'easyocr':
+                _log.info('[OCR] 初始化 EasyOCR 引擎（gpu={}, mirror={}）', gpu, mirror)
+                instance = EasyOCREngine(gpu=gpu, mirror=mirror)
+            elif engine == 'fastocr':
+                _log.info('[OCR] 初始化 FastOCR 引擎 (PP-OCRv6-small, CPU)')
+                instance = FastOCREngine()
+            else:
+                raise ValueError(f'不支持的 OCR 引擎: {engine}，可选: easyocr, fastocr')
             cls._instances[cache_key] = instance
             return instance
-        raise ValueError(f'不支持的 OCR 引擎: {engine}，可选: easyocr, fastocr')
 
 
 # ── 具体实现 ──
@@ -426,6 +433,8 @@ class EasyOCREngine(OCREngine):
     """基于 EasyOCR 的识别引擎。"""
 
     def __init__(self, gpu: bool = False, mirror: str = 'tencent') -> None:
+        import easyocr
+
         from autowsgr.vision.easyocr_models_checker import ensure_models
 
         ensure_models(mirror)
@@ -628,8 +637,24 @@ class FastOCREngine(OCREngine):
 
 
 def _fuzzy_match(text: str, candidates: list[str], threshold: int = 3) -> str | None:
-    """按明确关系和唯一编辑距离匹配舰名，不在歧义时猜测。"""
-    unique_candidates = list(dict.fromkeys(expand_ship_name_candidates(candidates)))
+    """按明确关系和唯一编辑距离匹配舰名，不在歧义时猜测。
+
+    结果按 (文本, 候选, 阈值) 缓存: 同一批舰船在多轮战斗中反复出现，
+    重复的 OCR 文本直接返回上次的匹配结果。
+    """
+    return _match_ship_name(text, tuple(candidates), threshold, ship_names_generation())
+
+
+@lru_cache(maxsize=_FUZZY_MATCH_CACHE_SIZE)
+def _match_ship_name(
+    text: str, candidates: tuple[str, ...], threshold: int, generation: int
+) -> str | None:
+    """:func:`_fuzzy_match` 的实现。
+
+    舰名分组 (含用户别名) 变更时 ``generation`` 随之变化，旧缓存自然失效;
+    船池匹配置信度变更时由 :func:`set_ship_name_match_confidence` 清空缓存。
+    """
+    unique_candidates = _expand_candidates(candidates, generation)
     if not text or not unique_candidates:
         return None
 
@@ -646,13 +671,8 @@ def _fuzzy_match(text: str, candidates: list[str], threshold: int = 3) -> str |
     effective_threshold = (
         0 if len(text) == 1 else min(threshold, 1) if len(text) <= 3 else threshold
     )
-    distances = [(name, _edit_distance(text, name)) for name in unique_candidates]
-    best_dist = min(distance for _, distance in distances)
-    nearest = list(
-        dict.fromkeys(
-            normalize_ship_name(name) for name, distance in distances if distance == best_dist
-        ),
-    )
+    best_dist, nearest_names = _nearest_candidates(text, unique_candidates)
+    nearest = list(dict.fromkeys(normalize_ship_name(name) for name in nearest_names))
     best_name = nearest[0] if len(nearest) == 1 and best_dist <= effective_threshold else None
 
     if best_name is not None:
@@ -678,6 +698,41 @@ def _fuzzy_match(text: str, candidates: list[str], threshold: int = 3) -> str |
     return None
 
 
+@lru_cache(maxsize=8)
+def _expand_candidates(candidates: tuple[str, ...], generation: int) -> list[str]:  # noqa: ARG001
+    """将候选扩展为同组全部名称并去重。
+
+    候选列表在多次调用间基本固定 (全局舰名表或当前舰队)，按候选与舰名
+    数据版本 ``generation`` 缓存扩展结果。返回值为共享对象，调用方不得修改。
+    """
+    return expand_ship_name_candidates(list(candidates))
+
+
+def _nearest_candidates(text: str, candidates: list[str]) -> tuple[int, list[str]]:
+    """返回最近编辑距离及所有取得该距离的候选 (保持候选顺序)。"""
+    if len(candidates) >= _VECTORIZED_MIN_CANDIDATES:
+        names = tuple(candidates)
+        distances = _edit_distances(text, *_pack_candidates(names))
+        best_dist = int(distances.min())
+        return best_dist, [names[i] for i in np.flatnonzero(distances == best_dist)]
+
+    # 长度差是编辑距离的下界: 超过当前最近距离的候选不可能成为 (并列) 最近者, 跳过 DP;
+    # 其余候选以当前最近距离为上限做带状 DP, 超出即提前返回
+    text_len = len(text)
+    best_dist = text_len + max(map(len, candidates))
+    nearest_names: list[str] = []
+    for name in candidates:
+        if abs(text_len - len(name)) > best_dist:
+            continue
+        distance = _edit_distance_bounded(text, name, best_dist)
+        if distance < best_dist:
+            best_dist = distance
+            nearest_names = [name]
+        elif distance == best_dist:
+            nearest_names.append(name)
+    return best_dist, nearest_names
+
+
 def _fuzzy_match_pool_aware(  # noqa: PLR0911
     text: str,
     candidates: list[str],
@@ -771,6 +826,8 @@ def _fuzzy_match_pool_aware(  # noqa: PLR0911
 
 def _edit_distance(a: str, b: str) -> int:
     """Levenshtein 编辑距离。"""
+    if a == b:
+        return 0
     m, n = len(a), len(b)
     dp = list(range(n + 1))
     for i in range(1, m + 1):
@@ -784,3 +841,66 @@ def _edit_distance(a: str, b: str) -> int:
             )
             prev = temp
     return dp[n]
+
+
+def _edit_distance_bounded(a: str, b: str, cutoff: int) -> int:
+    """上限为 ``cutoff`` 的 Levenshtein 编辑距离。
+
+    距离不超过 ``cutoff`` 时与 :func:`_edit_distance` 结果相同，否则返回 ``cutoff + 1``。
+    只计算主对角线两侧 ``cutoff`` 宽的带状区域 (Ukkonen)，某行最小值已超过
+    ``cutoff`` 时提前终止。
+    """
+    if a == b:
+        return 0
+    m, n = len(a), len(b)
+    if abs(m - n) > cutoff:
+        return cutoff + 1
+    over = cutoff + 1
+    dp = [min(j, over) for j in range(n + 1)]
+    for i in range(1, m + 1):
+        lo, hi = max(1, i - cutoff), min(n, i + cutoff)
+        diag = dp[lo - 1]
+        left = dp[lo - 1] = min(i, over) if lo == 1 else over
+        row_min = left
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            up = dp[j]
+            cur = diag if ca == b[j - 1] else diag + 1
+            if up < cur:
+                cur = up + 1
+            if left < cur:
+                cur = left + 1
+            diag = up
+            dp[j] = left = cur
+            row_min = min(row_min, cur)
+        if row_min > cutoff:
+            return over
+    return min(dp[n], over)
+
+
+@lru_cache(maxsize=8)
+def _pack_candidates(names: tuple[str, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """将候选名打包为码点矩阵 (不足处填 ``-1``) 与长度向量。"""
+    codes = np.full((len(names), max(map(len, names))), -1, dtype=np.int32)
+    for i, name in enumerate(names):
+        codes[i, : len(name)] = [ord(c) for c in name]
+    lengths = np.fromiter(map(len, names), dtype=np.intp, count=len(names))
+    return codes, lengths
+
+
+def _edit_distances(text: str, codes: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """``text`` 到每个已打包候选的 Levenshtein 编辑距离。
+
+    以候选为向量维度逐字符推进 DP 行。行内插入的依赖链
+    ``dp[j] = min(t[j], dp[j-1] + 1)`` 等价于 ``j + min(t[k] - k for k <= j)``，
+    用一次累积最小值求出，因此每个字符只需常数次数组运算。填充位不等于
+    任何码点，只影响各候选长度之后的列。
+    """
+    cols = np.arange(codes.shape[1] + 1, dtype=np.int32)
+    dp = np.broadcast_to(cols, (len(codes), len(cols)))
+    for i, ch in enumerate(text, 1):
+        t = np.empty_like(dp)
+        t[:, 0] = i
+        np.minimum(dp[:, :-1] + (codes != ord(ch)), dp[:, 1:] + 1, out=t[:, 1:])
+        dp = np.minimum.accumulate(t - cols, axis=1) + cols
+    return dp[np.arange(len(codes)), lengths]
@@ -72,11 +72,16 @@ class Color:
 
     def distance(self, other: Color) -> float:
         """欧几里得色彩距离。"""
-        return ((self.b - other.b) ** 2 + (self.g - other.g) ** 2 + (self.r - other.r) ** 2) ** 0.5
+        return self.distance_sq(other) ** 0.5
+
+    def distance_sq(self, other: Color) -> int:
+        """欧几里得色彩距离的平方 (免开方，用于阈值比较)。"""
+        dr, dg, db = self.r - other.r, self.g - other.g, self.b - other.b
+        return dr * dr + dg * dg + db * db
 
     def near(self, other: Color, tolerance: float = 30.0) -> bool:
         """判断两个颜色是否在容差范围内。"""
-        return self.distance(other) <= tolerance
+        return self.distance_sq(other) <= tolerance * tolerance
 
     # ── 转换 ──
 
@@ -203,6 +208,8 @@ class PixelSignature:
     rules: tuple[PixelRule, ...] | list[PixelRule]
     strategy: MatchStrategy = MatchStrategy.ALL
     threshold: int = 0
+    _resolved_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    """检测引擎的私有缓存 (按截图分辨率解析的像素索引与颜色数组)，不参与比较与序列化。"""
 
     def __post_init__(self) -> None:
         if isinstance(self.rules, list):
@@ -289,7 +296,7 @@ class PixelDetail:
     matched: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PixelMatchResult:
     """像素签名匹配结果。
 
@@ -304,7 +311,7 @@ class PixelMatchResult:
     """匹配的规则数。"""
     total_count: int
     """规则总数。"""
-    details: tuple[PixelDetail, ...] = field(default_factory=tuple)
+    details: tuple[PixelDetail, ...] = ()
     """每条规则的详细结果（可用于调试）。"""
 
     def __bool__(self) -> bool:
@@ -16,7 +16,7 @@ scrcpy.py 中定义。这里不重复声明该格式来校验实现自身——
 from __future__ import annotations
 
 import time
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
 import numpy as np
 import pytest
@@ -225,3 +225,26 @@ class TestScrcpyControllerScreenshot:
         result = ctrl.screenshot()
         assert result.shape == (2, 2, 3)
         assert result is img
+
+    def test_screenshot_waits_on_frame_ready(self):
+        """无帧时阻塞等待首帧信号，而非定时 sleep 轮询。"""
+        ctrl = ScrcpyController(serial='test', screenshot_timeout=5.0)
+        ctrl._ensure_stream_alive = MagicMock()
+        ctrl._alive = True
+        ctrl._last_frame = None
+
+        img = np.zeros((2, 2, 3), dtype=np.uint8)
+
+        def _wait(**_kw: float) -> bool:
+            ctrl._last_frame = img
+            return True
+
+        ctrl._frame_ready = MagicMock()
+        ctrl._frame_ready.wait.side_effect = _wait
+
+        with patch('autowsgr.emulator.controller.scrcpy.time.sleep') as mock_sleep:
+            result = ctrl.screenshot()
+
+        assert result is img
+        ctrl._frame_ready.wait.assert_called_once()
+        mock_sleep.assert_not_called()
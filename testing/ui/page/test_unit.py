@@ -14,8 +14,12 @@ from autowsgr.ui.page import (
     register_page,
 )
 from autowsgr.ui.utils import (
+    NavConfig,
     NavigationError,
+    click_and_wait_leave_page,
+    wait_for_any,
     wait_for_page,
+    wait_leave_page,
 )
 
 
@@ -67,6 +71,23 @@ class TestGetCurrentPage:
         register_page('good', lambda _s: True)
         assert get_current_page(_blank()) == 'good'
 
+    def test_exception_checker_keeps_being_tried(self):
+        """异常视为不匹配，但识别器不会被永久禁用。"""
+        bad = MagicMock(side_effect=[RuntimeError('boom'), RuntimeError('boom'), True])
+        register_page('flaky', bad)
+        assert get_current_page(_blank()) is None
+        assert get_current_page(_blank()) is None
+        assert get_current_page(_blank()) == 'flaky'
+        assert bad.call_count == 3
+
+    def test_skip_checker_not_called(self):
+        """``skip`` 指定的识别器不会被再次执行。"""
+        skipped = MagicMock(return_value=True)
+        register_page('skipped', skipped)
+        register_page('good', lambda _s: True)
+        assert get_current_page(_blank(), skip=skipped) == 'good'
+        skipped.assert_not_called()
+
 
 # ─────────────────────────────────────────────
 # wait_for_page
@@ -95,7 +116,7 @@ class TestWaitForPage:
         ctrl.screenshot.side_effect = screens
 
         with patch('autowsgr.ui.utils.navigation.time') as mock_time:
-            mock_time.monotonic.return_value = 0.0
+            mock_time.monotonic_ns.return_value = 0
             mock_time.sleep = MagicMock()
 
             result = wait_for_page(
@@ -116,17 +137,17 @@ class TestWaitForPage:
         ctrl = MagicMock(spec=AndroidController)
         ctrl.screenshot.return_value = _blank()
 
-        # 模拟时间: 第一次 monotonic=0, deadline=0, 立即超时
+        # 模拟时间: 第一次 monotonic_ns=0, deadline=0, 立即超时
         with patch('autowsgr.ui.utils.navigation.time') as mock_time:
             call_count = 0
 
-            def advancing_time() -> float:
+            def advancing_time() -> int:
                 nonlocal call_count
                 call_count += 1
-                # 第一次 (设 deadline) 返回 0, 之后返回 100 (已超时)
-                return 0.0 if call_count <= 1 else 100.0
+                # 第一次 (设 deadline) 返回 0, 之后返回 100s (已超时)
+                return 0 if call_count <= 1 else 100_000_000_000
 
-            mock_time.monotonic.side_effect = advancing_time
+            mock_time.monotonic_ns.side_effect = advancing_time
             mock_time.sleep = MagicMock()
 
             with pytest.raises(NavigationError, match='超时'):
@@ -137,3 +158,105 @@ class TestWaitForPage:
                     source='A',
                     target='B',
                 )
+
+
+# ─────────────────────────────────────────────
+# wait_for_any
+# ─────────────────────────────────────────────
+
+
+class TestWaitForAny:
+    def test_returns_first_matching_name(self):
+        """同一帧多个匹配时按字典顺序返回第一个，且只截图一次。"""
+        ctrl = MagicMock(spec=AndroidController)
+        ctrl.screenshot.return_value = _blank()
+        never = MagicMock(return_value=False)
+
+        name, screen = wait_for_any(
+            ctrl,
+            {'confirm': never, 'direct': lambda _s: True, 'other': lambda _s: True},
+        )
+
+        assert name == 'direct'
+        assert screen is ctrl.screenshot.return_value
+        never.assert_called_once()
+        ctrl.screenshot.assert_called_once()
+
+    def test_evaluates_all_checkers_per_frame(self):
+        """每帧评估所有 checker，后续帧匹配到的候选也能返回。"""
+        ctrl = MagicMock(spec=AndroidController)
+        ctrl.screenshot.side_effect = [_blank(), _white()]
+
+        with patch('autowsgr.ui.utils.navigation.time') as mock_time:
+            mock_time.monotonic_ns.return_value = 0
+            name, _ = wait_for_any(
+                ctrl,
+                {'dark': lambda _s: False, 'bright': lambda s: s.mean() > 100},
+                handle_overlays=False,
+            )
+
+        assert name == 'bright'
+        assert ctrl.screenshot.call_count == 2
+
+    def test_timeout_raises(self):
+        ctrl = MagicMock(spec=AndroidController)
+        ctrl.screenshot.return_value = _blank()
+
+        with patch('autowsgr.ui.utils.navigation.time') as mock_time:
+            mock_time.monotonic_ns.side_effect = [0, 100_000_000_000]
+            with pytest.raises(NavigationError, match=r'a \| b'):
+                wait_for_any(ctrl, {'a': lambda _s: False, 'b': lambda _s: False})
+
+    def test_empty_checkers(self):
+        with pytest.raises(ValueError, match='不能为空'):
+            wait_for_any(MagicMock(spec=AndroidController), {})
+
+
+# ─────────────────────────────────────────────
+# wait_leave_page
+# ─────────────────────────────────────────────
+
+
+class TestWaitLeavePage:
+    def setup_method(self):
+        self._backup = dict(_PAGE_REGISTRY)
+        _PAGE_REGISTRY.clear()
+
+    def teardown_method(self):
+        _PAGE_REGISTRY.clear()
+        _PAGE_REGISTRY.update(self._backup)
+
+    def test_source_checker_not_rerun_on_success(self):
+        """离开后识别到达页面 (日志用) 时不再重复执行原页面 checker。"""
+        ctrl = MagicMock(spec=AndroidController)
+        ctrl.screenshot.return_value = _blank()
+        source_checker = MagicMock(return_value=False)
+        register_page('source', source_checker)
+
+        result = wait_leave_page(ctrl, source_checker, source='A', target='B')
+
+        assert result is not None
+        source_checker.assert_called_once()
+
+    def test_retry_delay_applied_after_click(self):
+        """重试时先点击再等待 retry_delay，之后才截图。"""
+        events: list[str] = []
+        ctrl = MagicMock(spec=AndroidController)
+        ctrl.click.side_effect = lambda *_a, **_k: events.append('click')
+
+        def _screenshot() -> np.ndarray:
+            events.append('screenshot')
+            return _blank()
+
+        ctrl.screenshot.side_effect = _screenshot
+        checker = MagicMock(side_effect=[True, False])  # 第一轮仍在原页面, 第二轮已离开
+        config = NavConfig(max_retries=2, retry_delay=1.5, timeout=1.0)
+
+        with patch('autowsgr.ui.utils.navigation.time') as mock_time:
+            # 第一轮: deadline=0, 检查超时时已过期; 第二轮: deadline=0
+            mock_time.monotonic_ns.side_effect = [0, 100_000_000_000, 0]
+            mock_time.sleep.side_effect = lambda sec: events.append(f'sleep {sec}')
+
+            click_and_wait_leave_page(ctrl, (0.5, 0.5), checker, config=config)
+
+        assert events == ['click', 'screenshot', 'click', 'sleep 1.5', 'screenshot']
@@ -0,0 +1,53 @@
+"""测试 侧边栏页面识别。"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from autowsgr.ui.sidebar_page import MENU_PROBES, SidebarPage, SidebarTarget, _target_checkers
+
+
+_W, _H = 960, 540
+_GRAY = (57, 57, 57)
+_BLUE = (0, 160, 232)
+
+
+def _sidebar(colors: list[tuple[int, int, int]]) -> np.ndarray:
+    """构造 6 个菜单探测点为指定颜色的截图。"""
+    screen = np.full((_H, _W, 3), 200, dtype=np.uint8)
+    for (x, y), color in zip(MENU_PROBES, colors, strict=True):
+        screen[int(y * _H), int(x * _W)] = color
+    return screen
+
+
+class TestIsCurrentPage:
+    def test_all_gray(self):
+        assert SidebarPage.is_current_page(_sidebar([_GRAY] * 6))
+
+    def test_one_selected(self):
+        assert SidebarPage.is_current_page(_sidebar([_GRAY] * 3 + [_BLUE] + [_GRAY] * 2))
+
+    def test_two_selected(self):
+        assert not SidebarPage.is_current_page(_sidebar([_BLUE] * 2 + [_GRAY] * 4))
+
+    def test_foreign_color(self):
+        assert not SidebarPage.is_current_page(_sidebar([_GRAY] * 5 + [(200, 0, 0)]))
+
+    @pytest.mark.parametrize(('delta', 'expected'), [(17, True), (18, False)])
+    def test_tolerance_boundary(self, delta: int, expected: bool):
+        """距离 sqrt(3)*17≈29.4 在容差内，sqrt(3)*18≈31.2 超出。"""
+        shifted = tuple(c + delta for c in _GRAY)
+        assert SidebarPage.is_current_page(_sidebar([shifted] * 6)) is expected
+
+    def test_other_resolution(self):
+        screen = np.full((1080, 1920, 3), 200, dtype=np.uint8)
+        for x, y in MENU_PROBES:
+            screen[int(y * 1080), int(x * 1920)] = _GRAY
+        assert SidebarPage.is_current_page(screen)
+
+
+def test_target_checkers_cached_for_every_target():
+    checkers = _target_checkers()
+    assert set(checkers) == set(SidebarTarget)
+    assert _target_checkers() is checkers
@@ -0,0 +1,273 @@
+"""测试 标签页面统一检测层 (标签栏探测)。"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from autowsgr.ui import tabbed_page
+from autowsgr.ui.tabbed_page import (
+    TAB_BLUE,
+    TAB_DARK,
+    TAB_PROBES,
+    TabbarState,
+    TabbedPageType,
+    _binarize_tabbar,
+    _classify_cache,
+    _coverage,
+    _get_templates,
+    _match_page_type,
+    _pack,
+    _popcount,
+    classify,
+    get_active_tab_index,
+    identify_page_type,
+    is_tabbed_page,
+    make_page_checker,
+    make_tab_checker,
+)
+
+
+_W, _H = 960, 540
+_BLUE = TAB_BLUE.as_rgb_tuple()
+
+
+def _tabbar(active: int | None, *, w: int = _W, h: int = _H) -> np.ndarray:
+    """构造第 ``active`` 个探测点为蓝色、其余为暗色的截图。"""
+    screen = np.full((h, w, 3), 200, dtype=np.uint8)
+    for i, (x, y) in enumerate(TAB_PROBES):
+        screen[int(y * h), int(x * w)] = _BLUE if i == active else TAB_DARK
+    return screen
+
+
+class TestTabProbes:
+    @pytest.mark.parametrize('active', range(len(TAB_PROBES)))
+    def test_single_active_tab(self, active: int):
+        screen = _tabbar(active)
+        assert is_tabbed_page(screen)
+        assert get_active_tab_index(screen) == active
+
+    def test_no_active_tab(self):
+        screen = _tabbar(None)
+        assert not is_tabbed_page(screen)
+        assert get_active_tab_index(screen) is None
+
+    def test_two_active_tabs(self):
+        screen = _tabbar(0)
+        x, y = TAB_PROBES[3]
+        screen[int(y * _H), int(x * _W)] = _BLUE
+        assert not is_tabbed_page(screen)
+        assert get_active_tab_index(screen) == 0
+
+    @pytest.mark.parametrize(
+        ('color', 'expected'),
+        [((79, 79, 79), True), ((10, 10, 80), False), ((80, 0, 0), False)],
+    )
+    def test_dark_threshold(self, color: tuple[int, int, int], expected: bool):
+        """非激活点任一通道 ≥ 80 即不算暗色。"""
+        screen = _tabbar(1)
+        x, y = TAB_PROBES[4]
+        screen[int(y * _H), int(x * _W)] = color
+        assert is_tabbed_page(screen) is expected
+
+    def test_first_probe_short_circuits(self):
+        """首个探测点既不蓝也不暗时直接判否，不做整组判定。"""
+        screen = _tabbar(2)
+        x, y = TAB_PROBES[0]
+        screen[int(y * _H), int(x * _W)] = (200, 200, 200)
+        with patch('autowsgr.ui.tabbed_page._sample_tab_probes') as sample:
+            assert not is_tabbed_page(screen)
+        sample.assert_not_called()
+
+    def test_other_resolution(self):
+        screen = _tabbar(2, w=1920, h=1080)
+        assert is_tabbed_page(screen)
+        assert get_active_tab_index(screen) == 2
+
+
+class TestBinarizeTabbar:
+    @pytest.mark.parametrize(('w', 'h'), [(960, 540), (1280, 720), (1920, 1080)])
+    def test_standard_shape(self, w: int, h: int):
+        mask = _binarize_tabbar(np.zeros((h, w, 3), dtype=np.uint8))
+        assert mask.shape == (40, 600)
+        assert mask.dtype == np.bool_
+
+    def test_consistent_across_resolutions(self):
+        """同一画面放大到 1080p 后，二值化结果仍高度覆盖 960x540 的结果。"""
+        base = np.full((_H, _W, 3), TAB_DARK, dtype=np.uint8)
+        for i in range(5):
+            cv2.putText(
+                base,
+                f'TAB{i}',
+                (115 + 125 * i, 28),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.7,
+                (230, 230, 230),
+                2,
+            )
+        big = cv2.resize(base, (1920, 1080), interpolation=cv2.INTER_LINEAR)
+        test = _pack(_binarize_tabbar(big))
+        assert _coverage(test, _pack(_binarize_tabbar(base)), _popcount(test)) > 0.85
+
+
+class TestCoverage:
+    def test_matches_boolean_definition(self):
+        rng = np.random.default_rng(0)
+        test = rng.random((40, 600)) > 0.8
+        tmpl = rng.random((40, 600)) > 0.5
+        expected = (test & tmpl).sum() / test.sum()
+        packed = _pack(test)
+        assert _popcount(packed) == test.sum()
+        assert _coverage(packed, _pack(tmpl), _popcount(packed)) == pytest.approx(expected)
+
+    def test_popcount_fallback_without_bitwise_count(self):
+        """NumPy < 2.0 无 ``np.bitwise_count`` 时回退结果一致。"""
+        mask = np.random.default_rng(1).random((40, 600)) > 0.7
+        with patch.object(tabbed_page, '_HAS_BITWISE_COUNT', False):
+            assert _popcount(_pack(mask)) == mask.sum()
+
+    def test_empty_test_image(self):
+        empty = _pack(np.zeros((40, 600), dtype=bool))
+        assert _coverage(empty, _pack(np.ones((40, 600), dtype=bool)), 0) == 0.0
+
+
+class TestMatchPageType:
+    @staticmethod
+    def _exhaustive(test: np.ndarray) -> TabbedPageType | None:
+        """不剪枝的参考实现: 按模板原顺序逐一比较。"""
+        pop = _popcount(test)
+        best, best_score = None, -1.0
+        for page_type, tmpl in _get_templates().items():
+            score = _coverage(test, tmpl, pop)
+            if score > 0.6 and score > best_score:
+                best, best_score = page_type, score
+        return best
+
+    def test_pruned_matches_exhaustive(self, monkeypatch: pytest.MonkeyPatch):
+        """由真实模板加噪声构造测试掩码，剪枝 (以上次结果为初值) 后与穷举一致。"""
+        monkeypatch.setattr('autowsgr.ui.tabbed_page._last_match', None)
+        rng = np.random.default_rng(0)
+        templates = [
+            np.unpackbits(t.view(np.uint8)).reshape(40, 600) > 0 for t in _get_templates().values()
+        ]
+        for _ in range(200):
+            base = templates[rng.integers(len(templates))]
+            keep = rng.random(base.shape) < rng.uniform(0.3, 1.0)
+            noise = rng.random(base.shape) < rng.uniform(0.0, 0.3)
+            mask = (base & keep) | noise
+            monkeypatch.setattr('autowsgr.ui.tabbed_page._binarize_tabbar', lambda _s, m=mask: m)
+            assert _match_page_type(np.empty(0)) == self._exhaustive(_pack(mask))
+
+    def test_blank_tabbar(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(
+            'autowsgr.ui.tabbed_page._binarize_tabbar', lambda _s: np.zeros((40, 600), dtype=bool)
+        )
+        assert _match_page_type(np.empty(0)) is None
+
+    @staticmethod
+    def _use_template(monkeypatch: pytest.MonkeyPatch, page_type: TabbedPageType) -> None:
+        mask = np.unpackbits(_get_templates()[page_type].view(np.uint8)).reshape(40, 600) > 0
+        monkeypatch.setattr('autowsgr.ui.tabbed_page._binarize_tabbar', lambda _s: mask)
+
+    def test_last_match_seeds_pruning(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr('autowsgr.ui.tabbed_page._last_match', TabbedPageType.BUILD)
+        self._use_template(monkeypatch, TabbedPageType.BUILD)
+        with patch('autowsgr.ui.tabbed_page._coverage', wraps=_coverage) as coverage:
+            assert _match_page_type(np.empty(0)) == TabbedPageType.BUILD
+        coverage.assert_called_once()
+
+    def test_last_match_does_not_override_better_template(self, monkeypatch: pytest.MonkeyPatch):
+        """上一次结果只作剪枝初值: 其他模板覆盖度更高时仍返回后者，并更新记录。"""
+        templates = {
+            t: np.unpackbits(m.view(np.uint8)).reshape(40, 600) > 0
+            for t, m in _get_templates().items()
+        }
+        build, intensify = templates[TabbedPageType.BUILD], templates[TabbedPageType.INTENSIFY]
+        build_only = build & ~intensify
+        keep = np.random.default_rng(0).random(build.shape) < 0.15
+        mask = (build & intensify) | (build_only & keep)
+        monkeypatch.setattr('autowsgr.ui.tabbed_page._binarize_tabbar', lambda _s: mask)
+
+        monkeypatch.setattr('autowsgr.ui.tabbed_page._last_match', None)
+        fresh = _match_page_type(np.empty(0))
+        monkeypatch.setattr('autowsgr.ui.tabbed_page._last_match', TabbedPageType.INTENSIFY)
+        assert _match_page_type(np.empty(0)) == fresh == TabbedPageType.BUILD
+        assert tabbed_page._last_match == TabbedPageType.BUILD
+
+
+class TestIdentifyCache:
+    def setup_method(self):
+        _classify_cache.clear()
+
+    def teardown_method(self):
+        _classify_cache.clear()
+
+    def test_readonly_frame_identified_once(self):
+        screen = _tabbar(0)
+        screen.flags.writeable = False
+        with patch(
+            'autowsgr.ui.tabbed_page._match_page_type', return_value=TabbedPageType.MAP
+        ) as match:
+            assert identify_page_type(screen) == TabbedPageType.MAP
+            assert identify_page_type(screen) == TabbedPageType.MAP
+        match.assert_called_once()
+
+    def test_writeable_frame_not_cached(self):
+        screen = _tabbar(0)
+        with patch(
+            'autowsgr.ui.tabbed_page._match_page_type', return_value=TabbedPageType.MAP
+        ) as match:
+            identify_page_type(screen)
+            identify_page_type(screen)
+        assert match.call_count == 2
+
+    def test_equal_content_different_frame(self):
+        """缓存按对象身份而非内容匹配。"""
+        first, second = _tabbar(0), _tabbar(0)
+        first.flags.writeable = second.flags.writeable = False
+        with patch('autowsgr.ui.tabbed_page._match_page_type', return_value=None) as match:
+            identify_page_type(first)
+            identify_page_type(second)
+        assert match.call_count == 2
+
+    def test_classify_single_pass(self):
+        screen = _tabbar(3)
+        screen.flags.writeable = False
+        with patch(
+            'autowsgr.ui.tabbed_page._match_page_type', return_value=TabbedPageType.MAP
+        ) as match:
+            assert classify(screen) == TabbarState(True, TabbedPageType.MAP, 3)
+            assert identify_page_type(screen) == TabbedPageType.MAP
+        match.assert_called_once()
+
+    def test_classify_not_tabbed(self):
+        with patch('autowsgr.ui.tabbed_page._match_page_type') as match:
+            assert classify(_tabbar(None)) == TabbarState(False)
+        match.assert_not_called()
+
+    def test_checkers_share_one_classification(self):
+        """同一帧上多个 checker 只触发一次模板匹配。"""
+        screen = _tabbar(2)
+        screen.flags.writeable = False
+        checkers = [
+            make_tab_checker(TabbedPageType.MAP, 2),
+            make_tab_checker(TabbedPageType.MAP, 1),
+            make_page_checker(TabbedPageType.BUILD),
+            make_page_checker(TabbedPageType.MAP),
+        ]
+        with patch(
+            'autowsgr.ui.tabbed_page._match_page_type', return_value=TabbedPageType.MAP
+        ) as match:
+            assert [c(screen) for c in checkers] == [True, False, False, True]
+        match.assert_called_once()
+
+
+class TestTemplates:
+    def test_preloaded_packed_templates(self):
+        templates = _get_templates()
+        assert set(templates) == set(TabbedPageType)
+        assert all(t.dtype == np.uint64 and t.shape == (375,) for t in templates.values())
+        assert _get_templates() is templates
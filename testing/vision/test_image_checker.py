@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import weakref
+from unittest.mock import patch
+
+import cv2
+import numpy as np
 import pytest
 
 from autowsgr.vision import (
@@ -10,7 +15,9 @@ from autowsgr.vision import (
     ImageRule,
     ImageSignature,
     MatchStrategy,
+    image_matcher,
 )
+from autowsgr.vision.image_matcher import _gray_cache, _gray_crop
 
 from ._helpers import embed_template_in_screen, make_template, solid_screen
 
@@ -281,6 +288,38 @@ class TestFindAllOccurrences:
         )
         assert len(results) == 1
 
+    @pytest.mark.parametrize(('max_count', 'min_distance'), [(20, 10), (200, 3), (5, 40)])
+    def test_nms_matches_greedy_reference(self, max_count: int, min_distance: int):
+        """向量化抑制与逐个比较的贪心 NMS 结果一致。"""
+        rng = np.random.default_rng(max_count)
+        tmpl = make_template(seed=62, h=20, w=30)
+        scores = rng.random((521, 931)).astype(np.float32)
+
+        with patch('autowsgr.vision.image_matcher.cv2.matchTemplate', return_value=scores):
+            results = ImageChecker.find_all_occurrences(
+                solid_screen(0, 0, 0),
+                tmpl,
+                confidence=0.99,
+                max_count=max_count,
+                min_distance=min_distance,
+            )
+
+        ys, xs = np.where(scores >= 0.99)
+        expected: list[tuple[int, int]] = []
+        for idx in np.argsort(-scores[ys, xs]):
+            if len(expected) >= max_count:
+                break
+            cx, cy = int(xs[idx]) + 15, int(ys[idx]) + 10
+            if any(
+                abs(cx - ux) < min_distance and abs(cy - uy) < min_distance for ux, uy in expected
+            ):
+                continue
+            expected.append((cx, cy))
+
+        assert [
+            (round(d.top_left[0] * 960) + 15, round(d.top_left[1] * 540) + 10) for d in results
+        ] == expected
+
 
 # ─────────────────────────────────────────────
 # ImageChecker — identify
@@ -317,6 +356,129 @@ class TestIdentify:
         assert result is None
 
 
+# ─────────────────────────────────────────────
+# 按帧灰度裁切缓存
+# ─────────────────────────────────────────────
+
+
+class TestGrayCrop:
+    def setup_method(self):
+        ImageChecker.clear_cache()
+
+    def teardown_method(self):
+        ImageChecker.clear_cache()
+
+    def _rule_screen(self) -> tuple[np.ndarray, ImageRule]:
+        tmpls = [make_template(seed=s, h=30, w=40, name=f't{s}') for s in (90, 91, 92)]
+        screen = embed_template_in_screen(solid_screen(200, 200, 200), tmpls[2], x=500, y=300)
+        rule = ImageRule(name='r', templates=tmpls, roi=ROI(0.4, 0.4, 0.9, 0.9), confidence=0.9)
+        return screen, rule
+
+    def test_readonly_frame_converted_once_per_roi(self):
+        screen, rule = self._rule_screen()
+        screen.flags.writeable = False
+        with patch('autowsgr.vision.image_matcher.cv2.cvtColor', wraps=cv2.cvtColor) as cvt:
+            assert ImageChecker.match_rule(screen, rule)
+            assert ImageChecker.find_best(screen, rule.templates, roi=rule.roi) is not None
+        cvt.assert_called_once()
+
+    def test_writeable_frame_not_cached(self):
+        screen, rule = self._rule_screen()
+        assert ImageChecker.match_rule(screen, rule)
+        assert not _gray_cache
+
+    def test_crop_from_cached_full_frame(self):
+        screen = make_template(seed=93, h=540, w=960).image
+        screen.flags.writeable = False
+        roi = ROI(0.1, 0.2, 0.5, 0.6)
+        _gray_crop(screen, ROI.full().to_absolute(960, 540))
+        expected = cv2.cvtColor(roi.crop(screen), cv2.COLOR_RGB2GRAY)
+        assert np.array_equal(_gray_crop(screen, roi.to_absolute(960, 540)), expected)
+
+
+class TestMatchCache:
+    def setup_method(self):
+        ImageChecker.clear_cache()
+
+    def teardown_method(self):
+        ImageChecker.clear_cache()
+
+    SEARCH_ROI = ROI(0.25, 0.25, 0.5, 0.6)
+
+    def test_same_content_matched_once(self):
+        """内容相同的不同截图只执行一次 matchTemplate，结果一致。"""
+        tmpl = make_template(seed=95, h=30, w=40)
+        screen = embed_template_in_screen(solid_screen(200, 200, 200), tmpl, x=300, y=200)
+        with patch(
+            'autowsgr.vision.image_matcher.cv2.matchTemplate', wraps=cv2.matchTemplate
+        ) as match:
+            first = ImageChecker.find_template(screen, tmpl, roi=self.SEARCH_ROI, confidence=0.9)
+            second = ImageChecker.find_template(
+                screen.copy(), tmpl, roi=self.SEARCH_ROI, confidence=0.9
+            )
+        assert first is not None
+        assert first == second
+        match.assert_called_once()
+
+    def test_large_region_not_cached(self):
+        """搜索区域远大于模板时不缓存。"""
+        tmpl = make_template(seed=95, h=30, w=40)
+        screen = solid_screen(200, 200, 200)
+        with patch(
+            'autowsgr.vision.image_matcher.cv2.matchTemplate', wraps=cv2.matchTemplate
+        ) as match:
+            ImageChecker.find_template(screen, tmpl)
+            ImageChecker.find_template(screen, tmpl)
+        assert match.call_count == 2
+        assert not image_matcher._match_cache
+
+    def test_entry_for_other_template_not_hit(self):
+        """``id`` 被复用时 (弱引用指向别的模板) 不命中缓存。"""
+        tmpl = make_template(seed=95, h=30, w=40)
+        other = make_template(seed=94, h=30, w=40)
+        screen = solid_screen(200, 200, 200)
+        ImageChecker.find_template(screen, tmpl, roi=self.SEARCH_ROI)
+        for key, (_, score, loc) in image_matcher._match_cache.items():
+            image_matcher._match_cache[key] = (weakref.ref(other), score, loc)
+        with patch(
+            'autowsgr.vision.image_matcher.cv2.matchTemplate', wraps=cv2.matchTemplate
+        ) as match:
+            ImageChecker.find_template(screen, tmpl, roi=self.SEARCH_ROI)
+        match.assert_called_once()
+
+    def test_confidence_applied_after_cache(self):
+        tmpl = make_template(seed=96, h=30, w=40)
+        screen = embed_template_in_screen(solid_screen(200, 200, 200), tmpl, x=300, y=200)
+        assert (
+            ImageChecker.find_template(screen, tmpl, roi=self.SEARCH_ROI, confidence=0.9)
+            is not None
+        )
+        assert (
+            ImageChecker.find_template(screen, tmpl, roi=self.SEARCH_ROI, confidence=1.01) is None
+        )
+
+    def test_changed_content_rematched(self):
+        tmpl = make_template(seed=97, h=30, w=40)
+        screen = solid_screen(200, 200, 200)
+        assert ImageChecker.find_template(screen, tmpl, roi=self.SEARCH_ROI, confidence=0.9) is None
+        screen = embed_template_in_screen(screen, tmpl, x=300, y=200)
+        assert (
+            ImageChecker.find_template(screen, tmpl, roi=self.SEARCH_ROI, confidence=0.9)
+            is not None
+        )
+
+    def test_clear_cache(self):
+        tmpl = make_template(seed=98, h=30, w=40)
+        screen = solid_screen(200, 200, 200)
+        with patch(
+            'autowsgr.vision.image_matcher.cv2.matchTemplate', wraps=cv2.matchTemplate
+        ) as match:
+            ImageChecker.find_template(screen, tmpl, roi=self.SEARCH_ROI)
+            ImageChecker.clear_cache()
+            ImageChecker.find_template(screen, tmpl, roi=self.SEARCH_ROI)
+        assert match.call_count == 2
+
+
 # ─────────────────────────────────────────────
 # ImageChecker.crop
 # ─────────────────────────────────────────────
@@ -491,3 +653,15 @@ class TestMultiResolutionScaling:
         # source_resolution=None → fallback to global (960,540)
         same2 = ImageChecker._scale_template_if_needed(tmpl_img, 960, 540)
         assert same2 is tmpl_img
+
+    def test_template_gray_cached_per_resolution(self):
+        """缩放后的灰度模板按截图尺寸缓存，且与先缩放再转灰度一致。"""
+        tmpl = make_template(seed=85, h=30, w=40)
+        assert ImageChecker._template_gray(tmpl, 960, 540) is tmpl.image_gray
+
+        gray = ImageChecker._template_gray(tmpl, 1920, 1080)
+        expected = cv2.cvtColor(
+            ImageChecker._scale_template_if_needed(tmpl.image, 1920, 1080), cv2.COLOR_RGB2GRAY
+        )
+        assert np.array_equal(gray, expected)
+        assert ImageChecker._template_gray(tmpl, 1920, 1080) is gray
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import cv2
 import numpy as np
 import pytest
 
@@ -39,6 +40,12 @@ class TestImageTemplate:
         assert 'btn' in r
         assert '80x50' in r
 
+    def test_image_gray_precomputed(self):
+        tmpl = make_template(seed=101)
+        assert tmpl.image_gray.shape == tmpl.shape
+        assert np.array_equal(tmpl.image_gray, cv2.cvtColor(tmpl.image, cv2.COLOR_RGB2GRAY))
+        assert 'image_gray' not in repr(tmpl)
+
 
 # ─────────────────────────────────────────────
 # ImageMatchResult 布尔行为
@@ -9,6 +9,7 @@ import pytest
 
 from autowsgr.vision import (
     Color,
+    CompositePixelSignature,
     MatchStrategy,
     PixelChecker,
     PixelDetail,
@@ -89,6 +90,13 @@ class TestColor:
         b = Color.of(120, 110, 95)
         assert a.near(b)  # distance ≈ 22.9 < 30
 
+    def test_distance_sq_known_value(self):
+        a = Color.of(0, 0, 0)
+        b = Color.of(3, 4, 0)
+        assert a.distance_sq(b) == 25
+        assert a.near(b, tolerance=5.0)
+        assert not a.near(b, tolerance=4.99)
+
     def test_as_rgb_tuple(self):
         c = Color.of(5, 10, 15)
         assert c.as_rgb_tuple() == (5, 10, 15)
@@ -364,6 +372,21 @@ class TestPixelCheckerBatch:
         screen = solid_screen(0, 0, 0)
         assert PixelChecker.check_pixels(screen, []) == []
 
+    def test_batch_matches_single_pixel_api(self):
+        rng = np.random.default_rng(7)
+        screen = rng.integers(0, 256, (540, 960, 3), dtype=np.uint8)
+        positions = [tuple(p) for p in rng.random((50, 2))]
+        rules = [
+            PixelRule.of(x, y, tuple(int(c) for c in rng.integers(0, 256, 3)), tolerance=120.0)
+            for x, y in positions
+        ]
+        assert PixelChecker.get_pixels(screen, positions) == [
+            PixelChecker.get_pixel(screen, x, y) for x, y in positions
+        ]
+        assert PixelChecker.check_pixels(screen, rules) == [
+            PixelChecker.check_pixel(screen, r.x, r.y, r.color, r.tolerance) for r in rules
+        ]
+
 
 # ─────────────────────────────────────────────
 # PixelChecker.check_signature — ALL strategy
@@ -538,6 +561,164 @@ class TestCheckSignatureCount:
         assert result.matched is True
 
 
+# ─────────────────────────────────────────────
+# PixelChecker.check_signature — vectorized path
+# ─────────────────────────────────────────────
+
+
+class TestCheckSignatureVectorized:
+    """无详情的向量化路径与逐规则路径判定一致。"""
+
+    @pytest.mark.parametrize('seed', range(20))
+    @pytest.mark.parametrize(
+        ('strategy', 'threshold'),
+        [(MatchStrategy.ALL, 0), (MatchStrategy.ANY, 0), (MatchStrategy.COUNT, 3)],
+    )
+    def test_agrees_with_detailed_path(self, seed: int, strategy: MatchStrategy, threshold: int):
+        rng = np.random.default_rng(seed)
+        screen = rng.integers(0, 256, size=(54, 96, 3), dtype=np.uint8)
+        rules = []
+        for _ in range(6):
+            x, y = rng.random(2)
+            actual = screen[int(y * 54), int(x * 96)].astype(int)
+            # 一半规则取实际颜色附近，一半随机
+            color = (
+                actual + rng.integers(-20, 21, 3) if rng.random() < 0.5 else rng.integers(0, 256, 3)
+            )
+            rules.append(PixelRule.of(x, y, tuple(int(c) for c in np.clip(color, 0, 255))))
+        sig = PixelSignature(name='r', rules=rules, strategy=strategy, threshold=threshold)
+        fast = PixelChecker.check_signature(screen, sig)
+        slow = PixelChecker.check_signature(screen, sig, with_details=True)
+        assert fast.matched is slow.matched
+        if strategy is MatchStrategy.COUNT:
+            assert fast.matched_count == slow.matched_count
+
+    def test_all_matched_count_stops_at_first_failure(self):
+        screen = solid_screen(0, 0, 0)
+        sig = PixelSignature(
+            name='s',
+            rules=[
+                PixelRule.of(0.0, 0.0, (0, 0, 0)),
+                PixelRule.of(0.1, 0.1, (0, 0, 0)),
+                PixelRule.of(0.2, 0.2, (255, 255, 255)),  # fail
+                PixelRule.of(0.3, 0.3, (0, 0, 0)),
+            ],
+        )
+        result = PixelChecker.check_signature(screen, sig)
+        assert result.matched is False
+        assert result.matched_count == 2
+
+    def test_resolution_cache_per_shape(self):
+        sig = PixelSignature(name='s', rules=[PixelRule.of(0.5, 0.5, (255, 255, 255))])
+        small = np.zeros((10, 20, 3), dtype=np.uint8)
+        small[5, 10] = (255, 255, 255)
+        large = np.zeros((100, 200, 3), dtype=np.uint8)
+        assert PixelChecker.check_signature(small, sig).matched is True
+        assert PixelChecker.check_signature(large, sig).matched is False
+        assert set(sig._resolved_cache) == {(10, 20), (100, 200)}
+
+    def test_cache_excluded_from_equality(self):
+        rules = [PixelRule.of(0.5, 0.5, (0, 0, 0))]
+        a = PixelSignature(name='s', rules=rules)
+        b = PixelSignature(name='s', rules=rules)
+        PixelChecker.check_signature(solid_screen(0, 0, 0), a)
+        assert a == b
+        assert hash(a) == hash(b)
+
+
+# ─────────────────────────────────────────────
+# PixelChecker.compile_signature
+# ─────────────────────────────────────────────
+
+
+class TestCompileSignature:
+    """编译后的检测函数与 check_signature 判定一致。"""
+
+    # 100x100 screen: (0.10, 0.10) → row 10, col 10; (0.55, 0.30) → row 30, col 55
+    _RULES: ClassVar[list[PixelRule]] = [
+        PixelRule.of(0.10, 0.10, (200, 0, 0)),
+        PixelRule.of(0.55, 0.30, (0, 0, 200), tolerance=10.0),
+    ]
+
+    def _screen(self, second: tuple[int, int, int]) -> np.ndarray:
+        screen = np.full((100, 100, 3), 100, dtype=np.uint8)
+        screen[10, 10] = (200, 0, 0)
+        screen[30, 55] = second
+        return screen
+
+    @pytest.mark.parametrize(
+        ('strategy', 'threshold'),
+        [(MatchStrategy.ALL, 0), (MatchStrategy.ANY, 0), (MatchStrategy.COUNT, 2)],
+    )
+    @pytest.mark.parametrize('second', [(0, 0, 200), (0, 6, 206), (0, 8, 208), (100, 100, 100)])
+    def test_agrees_with_check_signature(
+        self, strategy: MatchStrategy, threshold: int, second: tuple[int, int, int]
+    ):
+        sig = PixelSignature(name='s', rules=self._RULES, strategy=strategy, threshold=threshold)
+        screen = self._screen(second)
+        expected = PixelChecker.check_signature(screen, sig).matched
+        assert PixelChecker.compile_signature(sig)(screen) is expected
+
+    def test_tolerance_boundary_is_inclusive(self):
+        sig = PixelSignature(name='s', rules=[PixelRule.of(0.0, 0.0, (0, 0, 0), tolerance=5.0)])
+        check = PixelChecker.compile_signature(sig)
+        assert check(solid_screen(3, 4, 0, h=10, w=10)) is True  # 距离恰好 5
+        assert check(solid_screen(3, 5, 0, h=10, w=10)) is False
+
+    def test_resolution_change(self):
+        """同一编译函数适配不同分辨率截图。"""
+        sig = PixelSignature(name='s', rules=[PixelRule.of(0.5, 0.5, (255, 255, 255))])
+        check = PixelChecker.compile_signature(sig)
+        small = np.zeros((10, 20, 3), dtype=np.uint8)
+        small[5, 10] = (255, 255, 255)
+        large = np.zeros((100, 200, 3), dtype=np.uint8)
+        assert check(small) is True
+        assert check(large) is False
+        large[50, 100] = (255, 255, 255)
+        assert check(large) is True
+
+    def test_shares_resolution_with_check_signature(self):
+        """编译函数与 check_signature 共用签名上的同一份解析结果。"""
+        sig = PixelSignature(name='s', rules=self._RULES)
+        PixelChecker.compile_signature(sig)(self._screen((0, 0, 200)))
+        resolved = sig._resolved_cache[(100, 100)]
+        PixelChecker.check_signature(self._screen((0, 0, 200)), sig)
+        assert sig._resolved_cache[(100, 100)] is resolved
+
+    def test_empty_rules(self):
+        screen = solid_screen(0, 0, 0, h=10, w=10)
+        all_sig = PixelSignature(name='all', rules=[])
+        any_sig = PixelSignature(name='any', rules=[], strategy=MatchStrategy.ANY)
+        assert PixelChecker.compile_signature(all_sig)(screen) is True
+        assert PixelChecker.compile_signature(any_sig)(screen) is False
+
+    def test_composite_or(self):
+        screen = solid_screen(0, 0, 0, h=10, w=10)
+        miss = PixelSignature(name='miss', rules=[PixelRule.of(0.0, 0.0, (255, 255, 255))])
+        hit = PixelSignature(name='hit', rules=[PixelRule.of(0.0, 0.0, (0, 0, 0))])
+        assert PixelChecker.compile_signature(CompositePixelSignature.any_of('c', miss, hit))(
+            screen
+        )
+        assert not PixelChecker.compile_signature(CompositePixelSignature.any_of('c', miss))(screen)
+
+
+class TestCompileSignatures:
+    def test_results_in_order_with_shared_points(self):
+        screen = np.zeros((10, 10, 3), dtype=np.uint8)
+        screen[5, 5] = (255, 255, 255)
+        white = PixelSignature(name='w', rules=[PixelRule.of(0.5, 0.5, (255, 255, 255))])
+        black = PixelSignature(name='b', rules=[PixelRule.of(0.5, 0.5, (0, 0, 0))])
+        both = PixelSignature(
+            name='wb',
+            rules=[PixelRule.of(0.5, 0.5, (255, 255, 255)), PixelRule.of(0.0, 0.0, (0, 0, 0))],
+        )
+        check = PixelChecker.compile_signatures([white, black, both])
+        assert check(screen) == [True, False, True]
+
+    def test_empty(self):
+        assert PixelChecker.compile_signatures([])(solid_screen(0, 0, 0, h=4, w=4)) == []
+
+
 # ─────────────────────────────────────────────
 # PixelChecker.identify / identify_all
 # ─────────────────────────────────────────────
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 from typing import ClassVar
 from unittest.mock import MagicMock, patch
@@ -14,13 +17,20 @@ from autowsgr.constants import (
     SHIPNAMES,
     get_ship_name_variants,
     normalize_ship_name,
+    set_ship_name_aliases,
     ship_name_identity,
 )
 from autowsgr.vision import OCREngine, OCRResult, ShipNameMismatchError
 from autowsgr.vision.ocr import (
     EasyOCREngine,
     FastOCREngine,
+    _edit_distance,
+    _edit_distance_bounded,
+    _edit_distances,
+    _expand_candidates,
     _fuzzy_match,
+    _match_ship_name,
+    _pack_candidates,
     apply_ship_patches,
     set_ship_name_match_confidence,
 )
@@ -68,7 +78,7 @@ class TestLevelOCREngines:
     def test_easyocr_disables_cpu_quantization(self):
         with (
             patch('autowsgr.vision.easyocr_models_checker.ensure_models'),
-            patch('autowsgr.vision.ocr.easyocr.Reader') as reader,
+            patch('easyocr.Reader') as reader,
         ):
             EasyOCREngine(gpu=False)
 
@@ -233,6 +243,10 @@ class TestOCRResult:
 class TestFuzzyMatch:
     SHIP_NAMES: ClassVar[list[str]] = ['雪风', '时雨', '由良', '爱宕', '高雄']
 
+    def setup_method(self):
+        _match_ship_name.cache_clear()
+        _expand_candidates.cache_clear()
+
     def test_exact_match(self):
         assert _fuzzy_match('雪风', self.SHIP_NAMES) == '雪风'
 
@@ -264,6 +278,68 @@ class TestFuzzyMatch:
         result = _fuzzy_match('abcd', ['abce'], threshold=3)
         assert result == 'abce'  # distance = 1
 
+    def test_length_prefilter_skips_distant_candidates(self):
+        candidates = ['雪风', '由良', '约克城号航空母舰']
+        with patch(
+            'autowsgr.vision.ocr._edit_distance_bounded', wraps=_edit_distance_bounded
+        ) as dist:
+            assert _fuzzy_match('雪风', candidates) == '雪风'
+        assert [c.args[1] for c in dist.call_args_list] == ['雪风', '由良']
+
+    @pytest.mark.parametrize('count', [20, 200])
+    def test_pruned_matches_exhaustive(self, count: int):
+        """剪枝 (少量候选) 与向量化 (大量候选) 的结果均与逐一计算全部候选一致 (含并列拒绝)。"""
+        rng = np.random.default_rng(count)
+        alphabet = list('雪风时雨由良爱宕高雄号')
+        candidates = [''.join(rng.choice(alphabet, rng.integers(1, 7))) for _ in range(count)]
+        for _ in range(300):
+            text = ''.join(rng.choice(alphabet, rng.integers(1, 9)))
+            dists = {name: _edit_distance(text, name) for name in candidates}
+            best = min(dists.values())
+            nearest = list(dict.fromkeys(n for n, d in dists.items() if d == best))
+            limit = 0 if len(text) == 1 else 1 if len(text) <= 3 else 3
+            expected = nearest[0] if len(nearest) == 1 and best <= limit else None
+            assert _fuzzy_match(text, candidates) == expected
+
+    def test_vectorized_distances_match_full_dp(self):
+        names = ('雪风', 'U-1206', '约克城号航空母舰', 'a', 'abcdefghij')
+        for text in ('雪凤', 'U1206', 'a', '航空母舰约克城', 'bcdefghijk'):
+            expected = [_edit_distance(text, name) for name in names]
+            assert _edit_distances(text, *_pack_candidates(names)).tolist() == expected
+
+    def test_repeated_text_served_from_cache(self):
+        assert _fuzzy_match('雪凤', self.SHIP_NAMES) == '雪风'
+        with patch('autowsgr.vision.ocr._edit_distance_bounded') as dist:
+            assert _fuzzy_match('雪凤', self.SHIP_NAMES) == '雪风'
+        dist.assert_not_called()
+
+    def test_cache_cleared_when_confidence_changes(self):
+        _fuzzy_match('雪凤', self.SHIP_NAMES)
+        set_ship_name_match_confidence(0.0)
+        assert _match_ship_name.cache_info().currsize == 0
+
+    def test_alias_change_via_constants_api_invalidates_cache(self):
+        """直接调用 constants 层的别名接口后，缓存的匹配结果与候选扩展随之失效。"""
+        assert _fuzzy_match('契卡洛夫', ['85工程']) is None
+        try:
+            set_ship_name_aliases({'契卡洛夫': '85工程'})
+            assert _fuzzy_match('契卡洛夫', ['85工程']) == '85工程'
+        finally:
+            set_ship_name_aliases({})
+        assert _fuzzy_match('契卡洛夫', ['85工程']) is None
+
+    def test_expansion_cached_per_candidate_list(self):
+        _fuzzy_match('雪凤', self.SHIP_NAMES)
+        _fuzzy_match('时两', self.SHIP_NAMES)
+        assert _expand_candidates.cache_info().hits >= 1
+
+    def test_bounded_distance_matches_full_dp(self):
+        rng = np.random.default_rng(1)
+        for _ in range(2000):
+            a, b = (''.join(rng.choice(list('abcd'), rng.integers(0, 9))) for _ in range(2))
+            cutoff = int(rng.integers(0, 10))
+            assert _edit_distance_bounded(a, b, cutoff) == min(_edit_distance(a, b), cutoff + 1)
+
 
 # ─────────────────────────────────────────────
 # OCREngine.recognize_single
@@ -423,6 +499,12 @@ class TestRecognizeShipNames:
         result = engine.recognize_ship_names(_dummy_image(), self.CANDIDATES)
         assert result == ['雪风']
 
+    def test_duplicate_texts_matched_once(self):
+        engine = self._engine('雪凤', '时雨', '雪凤')
+        with patch('autowsgr.vision.ocr._fuzzy_match', wraps=_fuzzy_match) as match:
+            assert engine.recognize_ship_names(_dummy_image(), self.CANDIDATES) == ['雪风', '时雨']
+        assert [c.args[0] for c in match.call_args_list] == ['雪凤', '时雨']
+
     def test_max_threshold_raises_on_large_distance(self):
         with pytest.raises(ShipNameMismatchError) as exc_info:
             self._engine('完全无关的长文本').recognize_ship_names(
@@ -433,6 +515,22 @@ class TestRecognizeShipNames:
         assert err.max_threshold == 4
         assert err.distance > 4
 
+    def test_max_threshold_reports_first_nearest_candidate(self):
+        """并列最近时报告候选列表中靠前者，距离与之对应。"""
+        with pytest.raises(ShipNameMismatchError) as exc_info:
+            self._engine('雪雨由良爱宕').recognize_ship_names(
+                _dummy_image(), self.CANDIDATES, threshold=1, max_threshold=3
+            )
+        err = exc_info.value
+        assert (err.best_candidate, err.distance) == ('由良', 4)
+
+    def test_max_threshold_on_full_ship_pool(self):
+        text = '完全无关的一段长文本'
+        expected = min(((c, _edit_distance(text, c)) for c in SHIPNAMES), key=lambda p: p[1])
+        with pytest.raises(ShipNameMismatchError) as exc_info:
+            self._engine(text).recognize_ship_names(_dummy_image(), max_threshold=2)
+        assert (exc_info.value.best_candidate, exc_info.value.distance) == expected
+
     def test_max_threshold_not_triggered_when_distance_within(self):
         # 编辑距离 = 1，threshold=2 → 匹配；max_threshold 无触发
         result = self._engine('雪凤').recognize_ship_names(
@@ -484,6 +582,26 @@ class TestOCREngineCreate:
         with pytest.raises(ValueError, match='不支持的 OCR 引擎'):
             OCREngine.create('rapidocr')
 
+    def test_concurrent_first_calls_create_one_instance(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(OCREngine, '_instances', {})
+        started = threading.Barrier(4)
+
+        def _slow_engine() -> object:
+            time.sleep(0.05)
+            return object()
+
+        with patch('autowsgr.vision.ocr.FastOCREngine', side_effect=_slow_engine) as engine:
+
+            def _create() -> OCREngine:
+                started.wait()
+                return OCREngine.create('fastocr')
+
+            with ThreadPoolExecutor(4) as pool:
+                instances = list(pool.map(lambda _i: _create(), range(4)))
+
+        engine.assert_called_once()
+        assert all(inst is instances[0] for inst in instances)
+
 
 class TestPoolAwareMatch:
     """测试安全舰名匹配、明确后缀和长舰名片段。"""